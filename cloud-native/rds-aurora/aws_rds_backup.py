@@ -5,294 +5,723 @@ Author: DBA Portfolio
 Purpose: Comprehensive AWS RDS and Aurora backup automation and monitoring
 """
 
+import asyncio
+import atexit
 import boto3
+import jmespath
 import json
 import sys
 import argparse
 import datetime
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Optional
-from botocore.exceptions import ClientError, NoCredentialsError
+import queue
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from botocore.config import Config
+from botocore.exceptions import ClientError, NoCredentialsError, WaiterError
+
+try:
+    import aioboto3
+except ImportError:  # optional, only needed for --use-async
+    aioboto3 = None
+
+try:
+    import orjson
+except ImportError:  # optional, faster report serialization
+    orjson = None
+
+# Keep parallel snapshot deletes modest to stay clear of RDS API throttling
+CLEANUP_MAX_WORKERS = 8
+METRIC_DATA_MAX_QUERIES = 500
+# Maximum MaxRecords accepted by the RDS describe APIs
+PAGE_SIZE = 100
+# Per-page retries for throttled describe calls on top of botocore's own retries
+THROTTLE_MAX_ATTEMPTS = 6
+THROTTLING_ERROR_CODES = ('Throttling', 'ThrottlingException', 'RequestLimitExceeded')
+EVENTS_RULE_NAME = 'aws-rds-backup-snapshot-events'
+EVENTS_QUEUE_NAME = 'aws-rds-backup-snapshot-events'
+SNAPSHOT_EVENT_TYPES = ['RDS DB Snapshot Event', 'RDS DB Cluster Snapshot Event']
+# Field mapping for the instance and cluster flavours of the snapshot APIs
+INSTANCE_SNAPSHOT_CFG = {
+    'api': 'describe_db_snapshots',
+    'id_arg': 'DBInstanceIdentifier',
+    'snapshot_arg': 'DBSnapshotIdentifier',
+    'resp_key': 'DBSnapshots',
+    'id_field': 'DBSnapshotIdentifier',
+    'src_field': 'DBInstanceIdentifier',
+    'enc_field': 'Encrypted',
+    'arn_field': 'DBSnapshotArn',
+    'type': 'Instance'
+}
+CLUSTER_SNAPSHOT_CFG = {
+    'api': 'describe_db_cluster_snapshots',
+    'id_arg': 'DBClusterIdentifier',
+    'snapshot_arg': 'DBClusterSnapshotIdentifier',
+    'resp_key': 'DBClusterSnapshots',
+    'id_field': 'DBClusterSnapshotIdentifier',
+    'src_field': 'DBClusterIdentifier',
+    'enc_field': 'StorageEncrypted',
+    'arn_field': 'DBClusterSnapshotArn',
+    'type': 'Cluster'
+}
+# Instance/cluster descriptions rarely change, so repeated runs may reuse them briefly
+DESCRIBE_CACHE_TTL = 300
+
+def _json_bytes(value) -> bytes:
+    """Compact JSON encoding used for streamed report fragments"""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NAIVE_UTC)
+    return json.dumps(value, default=str).encode()
+
+
+class SnapshotReportWriter:
+    """Writes a JSON report incrementally so snapshot lists never sit in memory"""
+    
+    def __init__(self, filename: str):
+        self.filename = filename
+        # Written under a temporary name and only renamed into place once complete
+        self._partial = Path(f"{filename}.partial")
+        self._file = open(self._partial, 'wb')
+        self._counts = [0]  # members written at each open nesting level
+        self._file.write(b'{')
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+    
+    def _separator(self):
+        if self._counts[-1]:
+            self._file.write(b',')
+        self._counts[-1] += 1
+    
+    def add_field(self, key: str, value):
+        """Write a complete key/value member of the current object"""
+        self._separator()
+        self._file.write(_json_bytes(key) + b':' + _json_bytes(value))
+    
+    def begin(self, key: str, container: bytes = b'{'):
+        """Open a nested object or array ('[') under key"""
+        self._separator()
+        self._file.write(_json_bytes(key) + b':' + container)
+        self._counts.append(0)
+    
+    def add_item(self, value):
+        """Append one element to the currently open array"""
+        self._separator()
+        self._file.write(_json_bytes(value))
+    
+    def end(self, container: bytes = b'}') -> int:
+        """Close the innermost container and return how many members it held"""
+        self._file.write(container)
+        return self._counts.pop()
+    
+    def close(self):
+        if not self._file.closed:
+            self._file.write(b'}\n')
+            self._file.close()
+            self._partial.replace(self.filename)
+    
+    def discard(self):
+        """Drop a report abandoned mid-stream so no truncated JSON is left behind"""
+        if not self._file.closed:
+            self._file.close()
+        self._partial.unlink(missing_ok=True)
+
 
 class AWSRDSBackupManager:
-    def __init__(self, region: str = 'us-east-1', profile: Optional[str] = None):
+    _log_listener: Optional[QueueListener] = None
+    
+    def __init__(self, region: str = 'us-east-1', profile: Optional[str] = None, use_cache: bool = True):
         self.region = region
+        self.profile = profile
+        self.use_cache = use_cache
+        self._describe_cache: Dict[str, List[Dict]] = {}
+        self.snapshot_inventory: Optional[Dict[str, Dict]] = None
         self.setup_logging()
         self.setup_aws_clients(profile)
         
     def setup_logging(self):
-        """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
+        """Setup logging configuration; console and file writes run on a listener thread"""
+        if AWSRDSBackupManager._log_listener is None:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            handlers = [
                 logging.StreamHandler(sys.stdout),
                 logging.FileHandler(f'aws_rds_backup_{datetime.datetime.now().strftime("%Y%m%d")}.log')
             ]
-        )
+            for handler in handlers:
+                handler.setFormatter(formatter)
+            
+            log_queue = queue.Queue(-1)
+            logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+            
+            AWSRDSBackupManager._log_listener = QueueListener(log_queue, *handlers)
+            AWSRDSBackupManager._log_listener.start()
+            # Flush queued records before the interpreter exits
+            atexit.register(AWSRDSBackupManager._log_listener.stop)
+        
         self.logger = logging.getLogger(__name__)
     
+    @cached_property
+    def client_config(self) -> Config:
+        """Shared botocore configuration for all AWS clients"""
+        return Config(
+            region_name=self.region,
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+            # Large enough that parallel cleanup/report workers never wait on a socket
+            max_pool_connections=64,
+            tcp_keepalive=True,
+            connect_timeout=5,
+            read_timeout=30
+        )
+    
     def setup_aws_clients(self, profile: Optional[str]):
-        """Setup AWS service clients"""
+        """Setup the AWS session and RDS client; other clients are created on first use"""
+        # profile_name=None resolves the default credential chain
+        self.boto_session = boto3.Session(profile_name=profile)
+        self.rds = self.boto_session.client('rds', config=self.client_config)
+    
+    @cached_property
+    def account_id(self) -> Optional[str]:
+        """AWS account the session's credentials belong to, looked up once; None if STS is unavailable"""
         try:
-            if profile:
-                session = boto3.Session(profile_name=profile)
-                self.rds = session.client('rds', region_name=self.region)
-                self.cloudwatch = session.client('cloudwatch', region_name=self.region)
-                self.sns = session.client('sns', region_name=self.region)
-            else:
-                self.rds = boto3.client('rds', region_name=self.region)
-                self.cloudwatch = boto3.client('cloudwatch', region_name=self.region)
-                self.sns = boto3.client('sns', region_name=self.region)
-            
-            # Test credentials
-            self.rds.describe_db_instances(MaxRecords=1)
-            self.logger.info(f"AWS clients initialized successfully for region: {self.region}")
+            return self.boto_session.client('sts', config=self.client_config).get_caller_identity()['Account']
+        except (ClientError, NoCredentialsError) as e:
+            self.logger.warning("Could not resolve the AWS account, keying the local cache by profile only: %s", e)
+            return None
+    
+    @cached_property
+    def cloudwatch(self):
+        """CloudWatch client, created on first use"""
+        return self.boto_session.client('cloudwatch', config=self.client_config)
+    
+    @cached_property
+    def sns(self):
+        """SNS client, created on first use"""
+        return self.boto_session.client('sns', config=self.client_config)
+    
+    @cached_property
+    def sqs(self):
+        """SQS client, created on first use"""
+        return self.boto_session.client('sqs', config=self.client_config)
+    
+    @cached_property
+    def events(self):
+        """EventBridge client, created on first use"""
+        return self.boto_session.client('events', config=self.client_config)
+    
+    def validate_credentials(self):
+        """Verify AWS credentials with a minimal RDS call"""
+        try:
+            self.rds.describe_db_instances(MaxRecords=20)
+            self.logger.info("AWS clients initialized successfully for region: %s", self.region)
             
         except NoCredentialsError:
             self.logger.error("AWS credentials not found. Configure credentials or use --profile option.")
             sys.exit(1)
         except ClientError as e:
-            self.logger.error(f"Failed to initialize AWS clients: {e}")
+            self.logger.error("Failed to initialize AWS clients: %s", e)
             sys.exit(1)
     
+    @staticmethod
+    def _instance_record(db: Dict) -> Dict:
+        """Build the report record for a describe_db_instances entry"""
+        record = {
+            'DBInstanceIdentifier': db['DBInstanceIdentifier'],
+            'DBInstanceClass': db['DBInstanceClass'],
+            'Engine': db['Engine'],
+            'EngineVersion': db['EngineVersion'],
+            'DBInstanceStatus': db['DBInstanceStatus'],
+            'AllocatedStorage': db.get('AllocatedStorage', 0),
+            'StorageType': db.get('StorageType', 'Unknown'),
+            'MultiAZ': db.get('MultiAZ', False),
+            'BackupRetentionPeriod': db.get('BackupRetentionPeriod', 0),
+            'PreferredBackupWindow': db.get('PreferredBackupWindow', 'Unknown'),
+            'LatestRestorableTime': db.get('LatestRestorableTime'),
+            'DeletionProtection': db.get('DeletionProtection', False),
+            'StorageEncrypted': db.get('StorageEncrypted', False)
+        }
+        
+        # Check if it's part of Aurora cluster
+        if db.get('DBClusterIdentifier'):
+            record['DBClusterIdentifier'] = db['DBClusterIdentifier']
+        
+        return record
+    
+    @staticmethod
+    def _cluster_record(cluster: Dict) -> Dict:
+        """Build the report record for a describe_db_clusters entry"""
+        return {
+            'DBClusterIdentifier': cluster['DBClusterIdentifier'],
+            'Engine': cluster['Engine'],
+            'EngineVersion': cluster['EngineVersion'],
+            'Status': cluster['Status'],
+            'DatabaseName': cluster.get('DatabaseName', 'Unknown'),
+            'BackupRetentionPeriod': cluster.get('BackupRetentionPeriod', 0),
+            'PreferredBackupWindow': cluster.get('PreferredBackupWindow', 'Unknown'),
+            'StorageEncrypted': cluster.get('StorageEncrypted', False),
+            'DeletionProtection': cluster.get('DeletionProtection', False),
+            'ClusterMembers': [member['DBInstanceIdentifier'] for member in cluster.get('DBClusterMembers', [])]
+        }
+    
+    @staticmethod
+    def _snapshot_record(snapshot: Dict, is_cluster: bool) -> Dict:
+        """Build the report record for a describe_db_snapshots / describe_db_cluster_snapshots entry"""
+        cfg = CLUSTER_SNAPSHOT_CFG if is_cluster else INSTANCE_SNAPSHOT_CFG
+        return {
+            'SnapshotId': snapshot[cfg['id_field']],
+            'SourceId': snapshot[cfg['src_field']],
+            'Type': cfg['type'],
+            'Status': snapshot['Status'],
+            'SnapshotCreateTime': snapshot['SnapshotCreateTime'],
+            'Engine': snapshot['Engine'],
+            'AllocatedStorage': snapshot.get('AllocatedStorage', 0),
+            'StorageEncrypted': snapshot.get(cfg['enc_field'], False),
+            'SnapshotArn': snapshot[cfg['arn_field']]
+        }
+    
+    def _cached_describe(self, name: str, fetch, datetime_fields: Tuple[str, ...] = ()) -> List[Dict]:
+        """Serve a full describe listing from memory or a short-lived on-disk cache"""
+        items = self._load_cached_describe(name, datetime_fields)
+        if items is None:
+            items = self._store_cached_describe(name, fetch())
+        return items
+    
+    def _load_cached_describe(self, name: str, datetime_fields: Tuple[str, ...] = ()) -> Optional[List[Dict]]:
+        """Return a cached describe listing, or None when it is missing or older than the TTL"""
+        if name in self._describe_cache:
+            return self._describe_cache[name]
+        
+        path = self.cache_dir() / f'{name}.json'
+        if not path.exists() or time.time() - path.stat().st_mtime >= DESCRIBE_CACHE_TTL:
+            return None
+        
+        with open(path) as f:
+            items = json.load(f)
+        for item in items:
+            for field in datetime_fields:
+                if item.get(field):
+                    item[field] = datetime.datetime.fromisoformat(item[field])
+        self.logger.info("Using cached %s from %s", name, path)
+        
+        self._describe_cache[name] = items
+        return items
+    
+    def _store_cached_describe(self, name: str, items: List[Dict]) -> List[Dict]:
+        """Remember a freshly fetched describe listing in memory and on disk"""
+        # An empty result may be a failed describe call; don't pin it for the TTL
+        if items:
+            path = self.cache_dir() / f'{name}.json'
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(items, f, default=lambda value: value.isoformat())
+        
+        self._describe_cache[name] = items
+        return items
+    
+    @staticmethod
+    def _throttle_delay(error: ClientError, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying a throttled call, or None if it should not be retried"""
+        if error.response['Error']['Code'] not in THROTTLING_ERROR_CODES or attempt == THROTTLE_MAX_ATTEMPTS:
+            return None
+        retry_after = error.response.get('ResponseMetadata', {}).get('HTTPHeaders', {}).get('retry-after')
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        # Equal jitter: half the capped exponential delay plus a random half
+        cap = min(32, 2 ** attempt)
+        return cap / 2 + random.uniform(0, cap / 2)
+    
+    def _iter_pages(self, operation: str, **params) -> Iterator[Dict]:
+        """Yield pages of an RDS describe call, following Marker and retrying throttled pages"""
+        method = getattr(self.rds, operation)
+        params['MaxRecords'] = PAGE_SIZE
+        
+        while True:
+            for attempt in range(THROTTLE_MAX_ATTEMPTS + 1):
+                try:
+                    page = method(**params)
+                    break
+                except ClientError as e:
+                    delay = self._throttle_delay(e, attempt)
+                    if delay is None:
+                        raise
+                    self.logger.warning("%s throttled, retrying page in %.1fs", operation, delay)
+                    time.sleep(delay)
+            
+            yield page
+            
+            if not page.get('Marker'):
+                return
+            params['Marker'] = page['Marker']
+    
     def get_rds_instances(self, instance_id: Optional[str] = None) -> List[Dict]:
         """Get RDS instances"""
+        if instance_id is None and self.use_cache:
+            return self._cached_describe('instances', self._describe_rds_instances, ('LatestRestorableTime',))
+        return self._describe_rds_instances(instance_id)
+    
+    def _describe_rds_instances(self, instance_id: Optional[str] = None) -> List[Dict]:
+        """Describe RDS instances"""
         try:
-            if instance_id:
-                response = self.rds.describe_db_instances(DBInstanceIdentifier=instance_id)
-            else:
-                response = self.rds.describe_db_instances()
+            params = {'DBInstanceIdentifier': instance_id} if instance_id else {}
+            pages = self._iter_pages('describe_db_instances', **params)
             
             instances = []
-            for db in response['DBInstances']:
-                instance_info = {
-                    'DBInstanceIdentifier': db['DBInstanceIdentifier'],
-                    'DBInstanceClass': db['DBInstanceClass'],
-                    'Engine': db['Engine'],
-                    'EngineVersion': db['EngineVersion'],
-                    'DBInstanceStatus': db['DBInstanceStatus'],
-                    'AllocatedStorage': db.get('AllocatedStorage', 0),
-                    'StorageType': db.get('StorageType', 'Unknown'),
-                    'MultiAZ': db.get('MultiAZ', False),
-                    'BackupRetentionPeriod': db.get('BackupRetentionPeriod', 0),
-                    'PreferredBackupWindow': db.get('PreferredBackupWindow', 'Unknown'),
-                    'LatestRestorableTime': db.get('LatestRestorableTime'),
-                    'DeletionProtection': db.get('DeletionProtection', False),
-                    'StorageEncrypted': db.get('StorageEncrypted', False)
-                }
-                
-                # Check if it's part of Aurora cluster
-                if db.get('DBClusterIdentifier'):
-                    instance_info['DBClusterIdentifier'] = db['DBClusterIdentifier']
-                
-                instances.append(instance_info)
+            for db in (db for page in pages for db in page['DBInstances']):
+                instances.append(self._instance_record(db))
             
             return instances
             
         except ClientError as e:
-            self.logger.error(f"Failed to get RDS instances: {e}")
+            self.logger.error("Failed to get RDS instances: %s", e)
             return []
     
     def get_aurora_clusters(self, cluster_id: Optional[str] = None) -> List[Dict]:
         """Get Aurora clusters"""
+        if cluster_id is None and self.use_cache:
+            return self._cached_describe('clusters', self._describe_aurora_clusters)
+        return self._describe_aurora_clusters(cluster_id)
+    
+    def _describe_aurora_clusters(self, cluster_id: Optional[str] = None) -> List[Dict]:
+        """Describe Aurora clusters"""
         try:
-            if cluster_id:
-                response = self.rds.describe_db_clusters(DBClusterIdentifier=cluster_id)
-            else:
-                response = self.rds.describe_db_clusters()
+            params = {'DBClusterIdentifier': cluster_id} if cluster_id else {}
+            pages = self._iter_pages('describe_db_clusters', **params)
             
             clusters = []
-            for cluster in response['DBClusters']:
-                cluster_info = {
-                    'DBClusterIdentifier': cluster['DBClusterIdentifier'],
-                    'Engine': cluster['Engine'],
-                    'EngineVersion': cluster['EngineVersion'],
-                    'Status': cluster['Status'],
-                    'DatabaseName': cluster.get('DatabaseName', 'Unknown'),
-                    'BackupRetentionPeriod': cluster.get('BackupRetentionPeriod', 0),
-                    'PreferredBackupWindow': cluster.get('PreferredBackupWindow', 'Unknown'),
-                    'StorageEncrypted': cluster.get('StorageEncrypted', False),
-                    'DeletionProtection': cluster.get('DeletionProtection', False),
-                    'ClusterMembers': [member['DBInstanceIdentifier'] for member in cluster.get('DBClusterMembers', [])]
-                }
-                clusters.append(cluster_info)
+            for cluster in (cluster for page in pages for cluster in page['DBClusters']):
+                clusters.append(self._cluster_record(cluster))
             
             return clusters
             
         except ClientError as e:
-            self.logger.error(f"Failed to get Aurora clusters: {e}")
+            self.logger.error("Failed to get Aurora clusters: %s", e)
             return []
     
     def create_manual_snapshot(self, identifier: str, snapshot_id: str, is_cluster: bool = False) -> bool:
         """Create manual snapshot"""
         try:
             if is_cluster:
-                self.logger.info(f"Creating manual snapshot for Aurora cluster: {identifier}")
+                self.logger.info("Creating manual snapshot for Aurora cluster: %s", identifier)
                 response = self.rds.create_db_cluster_snapshot(
                     DBClusterSnapshotIdentifier=snapshot_id,
                     DBClusterIdentifier=identifier
                 )
                 snapshot_arn = response['DBClusterSnapshot']['DBClusterSnapshotArn']
             else:
-                self.logger.info(f"Creating manual snapshot for RDS instance: {identifier}")
+                self.logger.info("Creating manual snapshot for RDS instance: %s", identifier)
                 response = self.rds.create_db_snapshot(
                     DBSnapshotIdentifier=snapshot_id,
                     DBInstanceIdentifier=identifier
                 )
                 snapshot_arn = response['DBSnapshot']['DBSnapshotArn']
             
-            self.logger.info(f"Snapshot creation initiated: {snapshot_arn}")
+            self.logger.info("Snapshot creation initiated: %s", snapshot_arn)
             
             # Wait for snapshot to complete
             if self.wait_for_snapshot_completion(snapshot_id, is_cluster):
-                self.logger.info(f"Snapshot completed successfully: {snapshot_id}")
+                self.logger.info("Snapshot completed successfully: %s", snapshot_id)
                 return True
             else:
-                self.logger.error(f"Snapshot creation failed or timed out: {snapshot_id}")
+                self.logger.error("Snapshot creation failed or timed out: %s", snapshot_id)
                 return False
                 
         except ClientError as e:
-            self.logger.error(f"Failed to create snapshot: {e}")
+            self.logger.error("Failed to create snapshot: %s", e)
             return False
     
     def wait_for_snapshot_completion(self, snapshot_id: str, is_cluster: bool = False, timeout: int = 3600) -> bool:
-        """Wait for snapshot to complete"""
-        import time
+        """Wait for snapshot to complete using the boto3 RDS waiters"""
+        self.logger.info("Waiting for snapshot completion: %s", snapshot_id)
         
-        start_time = time.time()
-        self.logger.info(f"Waiting for snapshot completion: {snapshot_id}")
+        delay = 30
+        try:
+            if is_cluster:
+                waiter = self.rds.get_waiter('db_cluster_snapshot_available')
+                waiter.wait(
+                    DBClusterSnapshotIdentifier=snapshot_id,
+                    WaiterConfig={'Delay': delay, 'MaxAttempts': max(1, timeout // delay)}
+                )
+            else:
+                waiter = self.rds.get_waiter('db_snapshot_available')
+                waiter.wait(
+                    DBSnapshotIdentifier=snapshot_id,
+                    WaiterConfig={'Delay': delay, 'MaxAttempts': max(1, timeout // delay)}
+                )
+            return True
+            
+        except WaiterError as e:
+            self.logger.error("Snapshot did not become available: %s (%s)", snapshot_id, e)
+            return False
+        except ClientError as e:
+            self.logger.error("Error checking snapshot status: %s", e)
+            return False
+    
+    def iter_snapshots(self, identifier: Optional[str] = None, is_cluster: bool = False) -> Iterator[Dict]:
+        """Yield manual snapshot records page by page"""
+        cfg = CLUSTER_SNAPSHOT_CFG if is_cluster else INSTANCE_SNAPSHOT_CFG
         
-        while time.time() - start_time < timeout:
-            try:
-                if is_cluster:
-                    response = self.rds.describe_db_cluster_snapshots(
-                        DBClusterSnapshotIdentifier=snapshot_id
-                    )
-                    status = response['DBClusterSnapshots'][0]['Status']
-                else:
-                    response = self.rds.describe_db_snapshots(
-                        DBSnapshotIdentifier=snapshot_id
-                    )
-                    status = response['DBSnapshots'][0]['Status']
-                
-                self.logger.info(f"Snapshot {snapshot_id} status: {status}")
-                
-                if status == 'available':
-                    return True
-                elif status in ['failed', 'deleted']:
-                    return False
-                
-                time.sleep(60)  # Wait 1 minute before checking again
-                
-            except ClientError as e:
-                self.logger.error(f"Error checking snapshot status: {e}")
-                return False
+        if self.snapshot_inventory is not None:
+            yield from [snapshot for snapshot in self.snapshot_inventory.values()
+                        if snapshot['Type'] == cfg['type'] and (not identifier or snapshot['SourceId'] == identifier)]
+            return
         
-        self.logger.error(f"Snapshot creation timed out: {snapshot_id}")
-        return False
+        params = {'SnapshotType': 'manual'}
+        if identifier:
+            params[cfg['id_arg']] = identifier
+        
+        for page in self._iter_pages(cfg['api'], **params):
+            for snapshot in page[cfg['resp_key']]:
+                yield self._snapshot_record(snapshot, is_cluster)
     
     def list_snapshots(self, identifier: Optional[str] = None, is_cluster: bool = False) -> List[Dict]:
         """List snapshots"""
         try:
-            snapshots = []
-            
-            if is_cluster:
-                if identifier:
-                    response = self.rds.describe_db_cluster_snapshots(
-                        DBClusterIdentifier=identifier,
-                        SnapshotType='manual'
-                    )
-                else:
-                    response = self.rds.describe_db_cluster_snapshots(SnapshotType='manual')
-                
-                for snapshot in response['DBClusterSnapshots']:
-                    snapshot_info = {
-                        'SnapshotId': snapshot['DBClusterSnapshotIdentifier'],
-                        'SourceId': snapshot['DBClusterIdentifier'],
-                        'Type': 'Cluster',
-                        'Status': snapshot['Status'],
-                        'SnapshotCreateTime': snapshot['SnapshotCreateTime'],
-                        'Engine': snapshot['Engine'],
-                        'AllocatedStorage': snapshot.get('AllocatedStorage', 0),
-                        'StorageEncrypted': snapshot.get('StorageEncrypted', False),
-                        'SnapshotArn': snapshot['DBClusterSnapshotArn']
-                    }
-                    snapshots.append(snapshot_info)
-            else:
-                if identifier:
-                    response = self.rds.describe_db_snapshots(
-                        DBInstanceIdentifier=identifier,
-                        SnapshotType='manual'
-                    )
-                else:
-                    response = self.rds.describe_db_snapshots(SnapshotType='manual')
-                
-                for snapshot in response['DBSnapshots']:
-                    snapshot_info = {
-                        'SnapshotId': snapshot['DBSnapshotIdentifier'],
-                        'SourceId': snapshot['DBInstanceIdentifier'],
-                        'Type': 'Instance',
-                        'Status': snapshot['Status'],
-                        'SnapshotCreateTime': snapshot['SnapshotCreateTime'],
-                        'Engine': snapshot['Engine'],
-                        'AllocatedStorage': snapshot.get('AllocatedStorage', 0),
-                        'StorageEncrypted': snapshot.get('Encrypted', False),
-                        'SnapshotArn': snapshot['DBSnapshotArn']
-                    }
-                    snapshots.append(snapshot_info)
-            
-            return snapshots
+            return list(self.iter_snapshots(identifier, is_cluster))
             
         except ClientError as e:
-            self.logger.error(f"Failed to list snapshots: {e}")
+            self.logger.error("Failed to list snapshots: %s", e)
             return []
     
     def delete_snapshot(self, snapshot_id: str, is_cluster: bool = False) -> bool:
         """Delete snapshot"""
         try:
             if is_cluster:
-                self.logger.info(f"Deleting cluster snapshot: {snapshot_id}")
+                self.logger.debug("Deleting cluster snapshot: %s", snapshot_id)
                 self.rds.delete_db_cluster_snapshot(
                     DBClusterSnapshotIdentifier=snapshot_id
                 )
             else:
-                self.logger.info(f"Deleting instance snapshot: {snapshot_id}")
+                self.logger.debug("Deleting instance snapshot: %s", snapshot_id)
                 self.rds.delete_db_snapshot(
                     DBSnapshotIdentifier=snapshot_id
                 )
             
-            self.logger.info(f"Snapshot deletion initiated: {snapshot_id}")
+            self.logger.debug("Snapshot deletion initiated: %s", snapshot_id)
+            if self.snapshot_inventory is not None:
+                self.snapshot_inventory.pop(snapshot_id, None)
             return True
             
         except ClientError as e:
-            self.logger.error(f"Failed to delete snapshot: {e}")
+            self.logger.error("Failed to delete snapshot: %s", e)
             return False
     
+    def iter_expired_snapshot_ids(self, cutoff_date: datetime.datetime, is_cluster: bool = False) -> Iterator[str]:
+        """Yield identifiers of available manual snapshots created before cutoff_date"""
+        cfg = CLUSTER_SNAPSHOT_CFG if is_cluster else INSTANCE_SNAPSHOT_CFG
+        
+        # Snapshots that are not 'available' (creating, deleting, ...) cannot be deleted anyway
+        if self.snapshot_inventory is not None:
+            yield from [snapshot['SnapshotId'] for snapshot in self.snapshot_inventory.values()
+                        if snapshot['Type'] == cfg['type'] and snapshot['Status'] == 'available'
+                        and snapshot['SnapshotCreateTime'] < cutoff_date]
+            return
+        
+        expression = jmespath.compile(
+            f"{cfg['resp_key']}[?Status=='available'].[{cfg['id_field']}, SnapshotCreateTime]"
+        )
+        
+        try:
+            # Project only the fields needed instead of building full snapshot records.
+            # SnapshotCreateTime is parsed to a datetime, which JMESPath cannot compare,
+            # so the date filter itself stays client-side.
+            for page in self._iter_pages(cfg['api'], SnapshotType='manual', IncludeShared=False):
+                for snapshot_id, created in expression.search(page) or []:
+                    if created < cutoff_date:
+                        yield snapshot_id
+                    
+        except ClientError as e:
+            self.logger.error("Failed to list snapshots: %s", e)
+    
     def cleanup_old_snapshots(self, retention_days: int = 7) -> Dict[str, int]:
         """Cleanup old manual snapshots"""
         cutoff_date = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=retention_days)
         deleted_counts = {'instances': 0, 'clusters': 0}
         
-        self.logger.info(f"Cleaning up snapshots older than {retention_days} days")
+        self.logger.info("Cleaning up snapshots older than %s days", retention_days)
         
-        # Clean up instance snapshots
-        instance_snapshots = self.list_snapshots(is_cluster=False)
-        for snapshot in instance_snapshots:
-            if snapshot['SnapshotCreateTime'] < cutoff_date:
-                if self.delete_snapshot(snapshot['SnapshotId'], is_cluster=False):
-                    deleted_counts['instances'] += 1
+        # Collect expired instance and cluster snapshots
+        tasks = []
+        for is_cluster in (False, True):
+            for snapshot_id in self.iter_expired_snapshot_ids(cutoff_date, is_cluster):
+                tasks.append((snapshot_id, is_cluster))
         
-        # Clean up cluster snapshots
-        cluster_snapshots = self.list_snapshots(is_cluster=True)
-        for snapshot in cluster_snapshots:
-            if snapshot['SnapshotCreateTime'] < cutoff_date:
-                if self.delete_snapshot(snapshot['SnapshotId'], is_cluster=True):
-                    deleted_counts['clusters'] += 1
+        self.logger.info("Deleting %s expired snapshots", len(tasks))
         
-        self.logger.info(f"Cleanup completed: {deleted_counts['instances']} instance snapshots, {deleted_counts['clusters']} cluster snapshots deleted")
+        # Deletes are independent API calls, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=CLEANUP_MAX_WORKERS) as executor:
+            results = list(executor.map(lambda task: self.delete_snapshot(*task), tasks))
+        
+        for (_, is_cluster), deleted in zip(tasks, results):
+            if deleted:
+                deleted_counts['clusters' if is_cluster else 'instances'] += 1
+        
+        self.logger.info("Cleanup completed: %s instance snapshots, %s cluster snapshots deleted",
+                         deleted_counts['instances'], deleted_counts['clusters'])
         return deleted_counts
     
+    def subscribe_events(self, queue_name: str = EVENTS_QUEUE_NAME) -> Optional[str]:
+        """Route RDS snapshot events from EventBridge into an SQS queue"""
+        try:
+            sqs = self.sqs
+            events = self.events
+            
+            queue_url = sqs.create_queue(QueueName=queue_name)['QueueUrl']
+            queue_arn = sqs.get_queue_attributes(
+                QueueUrl=queue_url, AttributeNames=['QueueArn']
+            )['Attributes']['QueueArn']
+            
+            rule_arn = events.put_rule(
+                Name=EVENTS_RULE_NAME,
+                EventPattern=json.dumps({'source': ['aws.rds'], 'detail-type': SNAPSHOT_EVENT_TYPES}),
+                State='ENABLED',
+                Description='Snapshot changes consumed by aws_rds_backup.py'
+            )['RuleArn']
+            
+            # Allow the rule to deliver into the queue
+            policy = {
+                'Version': '2012-10-17',
+                'Statement': [{
+                    'Effect': 'Allow',
+                    'Principal': {'Service': 'events.amazonaws.com'},
+                    'Action': 'sqs:SendMessage',
+                    'Resource': queue_arn,
+                    'Condition': {'ArnEquals': {'aws:SourceArn': rule_arn}}
+                }]
+            }
+            sqs.set_queue_attributes(QueueUrl=queue_url, Attributes={'Policy': json.dumps(policy)})
+            events.put_targets(Rule=EVENTS_RULE_NAME, Targets=[{'Id': 'snapshot-queue', 'Arn': queue_arn}])
+            
+            self.logger.info("Snapshot events routed to SQS queue: %s", queue_url)
+            return queue_url
+            
+        except ClientError as e:
+            self.logger.error("Failed to subscribe to RDS events: %s", e)
+            return None
+    
+    def cache_dir(self) -> Path:
+        """Per-account, per-profile and per-region directory for the describe cache and snapshot inventory"""
+        # Keyed by account so another profile's cached listings are never reported as this one's
+        cache_root = Path('.cache') / 'aws_rds_backup'
+        if self.account_id:
+            cache_root /= self.account_id
+        return cache_root / (self.profile or 'default') / self.region
+    
+    def inventory_path(self) -> Path:
+        """Location of the local snapshot inventory for this account and region"""
+        return self.cache_dir() / 'snapshots.json'
+    
+    def _describe_snapshot(self, snapshot_id: str, is_cluster: bool) -> Optional[Dict]:
+        """Describe a single manual snapshot, or None if it no longer exists"""
+        cfg = CLUSTER_SNAPSHOT_CFG if is_cluster else INSTANCE_SNAPSHOT_CFG
+        try:
+            response = getattr(self.rds, cfg['api'])(**{cfg['snapshot_arg']: snapshot_id})
+            snapshots = response[cfg['resp_key']]
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('DBSnapshotNotFound', 'DBClusterSnapshotNotFoundFault'):
+                return None
+            raise
+        
+        if not snapshots or snapshots[0].get('SnapshotType') != 'manual':
+            return None
+        return self._snapshot_record(snapshots[0], is_cluster)
+    
+    def sync_snapshot_inventory(self, queue_name: str = EVENTS_QUEUE_NAME, reconcile: bool = False):
+        """Load the local snapshot inventory and apply queued snapshot events to it"""
+        path = self.inventory_path()
+        
+        if reconcile or not path.exists():
+            # Cold start or reconciliation: enumerate everything once
+            self.logger.info("Building snapshot inventory from describe APIs")
+            self.snapshot_inventory = None
+            try:
+                # iter_snapshots raises, unlike list_snapshots, so a failed describe is never persisted
+                inventory = {snapshot['SnapshotId']: snapshot
+                             for is_cluster in (False, True)
+                             for snapshot in self.iter_snapshots(is_cluster=is_cluster)}
+            except ClientError as e:
+                self.logger.error("Failed to build snapshot inventory, using the describe APIs directly: %s", e)
+                return
+        else:
+            with open(path) as f:
+                inventory = json.load(f)
+            for snapshot in inventory.values():
+                snapshot['SnapshotCreateTime'] = datetime.datetime.fromisoformat(snapshot['SnapshotCreateTime'])
+        
+        # Messages are only deleted once the inventory holding their changes is on disk
+        receipt_handles = []
+        queue_url = None
+        try:
+            sqs = self.sqs
+            queue_url = sqs.get_queue_url(QueueName=queue_name)['QueueUrl']
+            
+            changes = 0
+            while True:
+                messages = sqs.receive_message(
+                    QueueUrl=queue_url, MaxNumberOfMessages=10, WaitTimeSeconds=1
+                ).get('Messages', [])
+                if not messages:
+                    break
+                
+                for message in messages:
+                    try:
+                        event = json.loads(message['Body'])
+                        if not isinstance(event, dict):
+                            raise ValueError("event body is not a JSON object")
+                    except ValueError as e:
+                        # Never parseable; drop it with the rest of the batch rather than redeliver it
+                        self.logger.warning("Skipping malformed snapshot event %s: %s", message.get('MessageId'), e)
+                        receipt_handles.append(message['ReceiptHandle'])
+                        continue
+                    
+                    snapshot_id = event.get('detail', {}).get('SourceIdentifier')
+                    if snapshot_id:
+                        is_cluster = event.get('detail-type') == 'RDS DB Cluster Snapshot Event'
+                        
+                        # Re-describe only the snapshot that changed
+                        snapshot = self._describe_snapshot(snapshot_id, is_cluster)
+                        if snapshot:
+                            inventory[snapshot_id] = snapshot
+                        else:
+                            inventory.pop(snapshot_id, None)
+                        changes += 1
+                    receipt_handles.append(message['ReceiptHandle'])
+            
+            self.logger.info("Applied %s snapshot events to inventory", changes)
+            
+        except ClientError as e:
+            self.logger.error("Failed to read snapshot events, inventory may be stale: %s", e)
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(inventory, f, indent=2, default=str)
+        
+        self.snapshot_inventory = inventory
+        
+        try:
+            # DeleteMessageBatch accepts at most 10 entries
+            for offset in range(0, len(receipt_handles), 10):
+                self.sqs.delete_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=[{'Id': str(i), 'ReceiptHandle': handle}
+                             for i, handle in enumerate(receipt_handles[offset:offset + 10])]
+                )
+        except ClientError as e:
+            # Undeleted events are redelivered and simply re-applied next run
+            self.logger.error("Failed to delete applied snapshot events: %s", e)
+    
     def modify_backup_settings(self, identifier: str, backup_retention_period: int, 
                               backup_window: Optional[str] = None, is_cluster: bool = False) -> bool:
         """Modify backup settings"""
@@ -307,59 +736,108 @@ class AWSRDSBackupManager:
             
             if is_cluster:
                 modify_params['DBClusterIdentifier'] = identifier
-                self.logger.info(f"Modifying backup settings for Aurora cluster: {identifier}")
+                self.logger.info("Modifying backup settings for Aurora cluster: %s", identifier)
                 self.rds.modify_db_cluster(**modify_params)
             else:
                 modify_params['DBInstanceIdentifier'] = identifier
-                self.logger.info(f"Modifying backup settings for RDS instance: {identifier}")
+                self.logger.info("Modifying backup settings for RDS instance: %s", identifier)
                 self.rds.modify_db_instance(**modify_params)
             
-            self.logger.info(f"Backup settings modified successfully for {identifier}")
+            self.logger.info("Backup settings modified successfully for %s", identifier)
             return True
             
         except ClientError as e:
-            self.logger.error(f"Failed to modify backup settings: {e}")
+            self.logger.error("Failed to modify backup settings: %s", e)
             return False
     
-    def get_backup_metrics(self, identifier: str, is_cluster: bool = False) -> Dict:
-        """Get backup-related CloudWatch metrics"""
-        try:
-            end_time = datetime.datetime.utcnow()
-            start_time = end_time - datetime.timedelta(days=1)
-            
-            namespace = 'AWS/RDS'
+    @staticmethod
+    def _metric_data_queries(identifiers: List[Tuple[str, bool]]) -> Tuple[List[Dict], Dict[str, Tuple[str, bool]]]:
+        """Build GetMetricData queries and a query-id to (identifier, is_cluster) map"""
+        queries = []
+        query_ids = {}
+        for i, (identifier, is_cluster) in enumerate(identifiers):
             dimension_name = 'DBClusterIdentifier' if is_cluster else 'DBInstanceIdentifier'
-            
-            metrics = {}
-            
-            # Get backup size metrics (if available)
-            try:
-                response = self.cloudwatch.get_metric_statistics(
-                    Namespace=namespace,
-                    MetricName='SnapshotStorageUsed',
-                    Dimensions=[{'Name': dimension_name, 'Value': identifier}],
+            query_id = f"m{i}"
+            query_ids[query_id] = (identifier, is_cluster)
+            queries.append({
+                'Id': query_id,
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/RDS',
+                        'MetricName': 'SnapshotStorageUsed',
+                        'Dimensions': [{'Name': dimension_name, 'Value': identifier}]
+                    },
+                    'Period': 3600,
+                    'Stat': 'Average'
+                },
+                'ReturnData': True
+            })
+        
+        return queries, query_ids
+    
+    @staticmethod
+    def _apply_metric_results(page: Dict, query_ids: Dict[str, Tuple[str, bool]],
+                              metrics_by_id: Dict[Tuple[str, bool], Dict]):
+        """Record the latest SnapshotStorageUsed value from a GetMetricData page"""
+        for result in page['MetricDataResults']:
+            key = query_ids[result['Id']]
+            # Results are newest first; keep the first value seen
+            if result['Values'] and metrics_by_id[key]['SnapshotStorageUsed'] is None:
+                metrics_by_id[key]['SnapshotStorageUsed'] = result['Values'][0]
+    
+    def get_backup_metrics_bulk(self, identifiers: List[Tuple[str, bool]]) -> Dict[Tuple[str, bool], Dict]:
+        """Get backup-related CloudWatch metrics for many resources in batched requests
+        
+        Results are keyed by (identifier, is_cluster), since an instance and a cluster may share a name.
+        """
+        metrics_by_id = {key: {'SnapshotStorageUsed': None} for key in identifiers}
+        if not identifiers:
+            return metrics_by_id
+        
+        end_time = datetime.datetime.now(datetime.timezone.utc)
+        start_time = end_time - datetime.timedelta(days=1)
+        queries, query_ids = self._metric_data_queries(identifiers)
+        
+        try:
+            paginator = self.cloudwatch.get_paginator('get_metric_data')
+            # GetMetricData accepts at most 500 queries per request
+            for offset in range(0, len(queries), METRIC_DATA_MAX_QUERIES):
+                pages = paginator.paginate(
+                    MetricDataQueries=queries[offset:offset + METRIC_DATA_MAX_QUERIES],
                     StartTime=start_time,
                     EndTime=end_time,
-                    Period=3600,
-                    Statistics=['Average']
+                    ScanBy='TimestampDescending'
                 )
-                
-                if response['Datapoints']:
-                    latest_size = max(response['Datapoints'], key=lambda x: x['Timestamp'])
-                    metrics['SnapshotStorageUsed'] = latest_size['Average']
-            except ClientError:
-                metrics['SnapshotStorageUsed'] = None
-            
-            return metrics
+                for page in pages:
+                    self._apply_metric_results(page, query_ids, metrics_by_id)
             
         except ClientError as e:
-            self.logger.error(f"Failed to get backup metrics: {e}")
-            return {}
+            self.logger.error("Failed to get backup metrics: %s", e)
+        
+        return metrics_by_id
     
     def generate_backup_report(self) -> Dict:
         """Generate comprehensive backup report"""
+        instances = self.get_rds_instances()
+        clusters = self.get_aurora_clusters()
+        
+        # Fetch CloudWatch metrics for all resources in batched requests
+        metrics_by_id = self.get_backup_metrics_bulk(
+            [(instance['DBInstanceIdentifier'], False) for instance in instances] +
+            [(cluster['DBClusterIdentifier'], True) for cluster in clusters]
+        )
+        
+        # Get snapshots
+        instance_snapshots = self.list_snapshots(is_cluster=False)
+        cluster_snapshots = self.list_snapshots(is_cluster=True)
+        
+        return self._build_report(instances, clusters, instance_snapshots, cluster_snapshots, metrics_by_id)
+    
+    def _build_report(self, instances: List[Dict], clusters: List[Dict], instance_snapshots: List[Dict],
+                      cluster_snapshots: List[Dict], metrics_by_id: Dict[Tuple[str, bool], Dict]) -> Dict:
+        """Assemble the backup report from already-fetched resources"""
         report = {
-            'timestamp': datetime.datetime.now().isoformat(),
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
             'region': self.region,
             'rds_instances': [],
             'aurora_clusters': [],
@@ -375,14 +853,9 @@ class AWSRDSBackupManager:
             }
         }
         
-        # Get RDS instances
-        instances = self.get_rds_instances()
+        # Attach metrics and check backup configuration in a single pass per resource type
         for instance in instances:
-            instance['backup_metrics'] = self.get_backup_metrics(
-                instance['DBInstanceIdentifier'], is_cluster=False
-            )
-            
-            # Check backup configuration
+            instance['backup_metrics'] = metrics_by_id[(instance['DBInstanceIdentifier'], False)]
             if instance['BackupRetentionPeriod'] == 0:
                 report['summary']['backup_issues'].append(
                     f"Instance {instance['DBInstanceIdentifier']} has automated backups disabled"
@@ -391,14 +864,8 @@ class AWSRDSBackupManager:
         report['rds_instances'] = instances
         report['summary']['total_instances'] = len(instances)
         
-        # Get Aurora clusters
-        clusters = self.get_aurora_clusters()
         for cluster in clusters:
-            cluster['backup_metrics'] = self.get_backup_metrics(
-                cluster['DBClusterIdentifier'], is_cluster=True
-            )
-            
-            # Check backup configuration
+            cluster['backup_metrics'] = metrics_by_id[(cluster['DBClusterIdentifier'], True)]
             if cluster['BackupRetentionPeriod'] == 0:
                 report['summary']['backup_issues'].append(
                     f"Cluster {cluster['DBClusterIdentifier']} has automated backups disabled"
@@ -407,26 +874,78 @@ class AWSRDSBackupManager:
         report['aurora_clusters'] = clusters
         report['summary']['total_clusters'] = len(clusters)
         
-        # Get snapshots
-        instance_snapshots = self.list_snapshots(is_cluster=False)
-        cluster_snapshots = self.list_snapshots(is_cluster=True)
-        
         report['snapshots']['instances'] = instance_snapshots
         report['snapshots']['clusters'] = cluster_snapshots
         report['summary']['total_snapshots'] = len(instance_snapshots) + len(cluster_snapshots)
         
         return report
     
+    def write_backup_report(self, filename: str = None) -> Dict:
+        """Generate the backup report straight to a JSON file, streaming snapshots as they are paged in
+        
+        Returns a report holding the summary and only the most recent snapshots, for print_summary.
+        """
+        filename = filename or self._default_report_filename()
+        
+        instances = self.get_rds_instances()
+        clusters = self.get_aurora_clusters()
+        metrics_by_id = self.get_backup_metrics_bulk(
+            [(instance['DBInstanceIdentifier'], False) for instance in instances] +
+            [(cluster['DBClusterIdentifier'], True) for cluster in clusters]
+        )
+        report = self._build_report(instances, clusters, [], [], metrics_by_id)
+        
+        def written(snapshots: Iterator[Dict]) -> Iterator[Dict]:
+            for snapshot in snapshots:
+                writer.add_item(snapshot)
+                yield snapshot
+        
+        with SnapshotReportWriter(filename) as writer:
+            for key in ('timestamp', 'region', 'rds_instances', 'aurora_clusters'):
+                writer.add_field(key, report[key])
+            
+            writer.begin('snapshots')
+            for key, is_cluster in (('instances', False), ('clusters', True)):
+                writer.begin(key, b'[')
+                try:
+                    # Only the newest snapshots are kept for the console summary
+                    report['snapshots'][key] = heapq.nlargest(
+                        10, written(self.iter_snapshots(is_cluster=is_cluster)),
+                        key=itemgetter('SnapshotCreateTime')
+                    )
+                except ClientError as e:
+                    self.logger.error("Failed to list snapshots: %s", e)
+                report['summary']['total_snapshots'] += writer.end(b']')
+            writer.end(b'}')
+            
+            writer.add_field('summary', report['summary'])
+        
+        self.logger.info("Report saved to: %s", filename)
+        return report
+    
+    @staticmethod
+    def _default_report_filename() -> str:
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"aws_rds_backup_report_{timestamp}.json"
+    
     def save_report(self, report: Dict, filename: str = None) -> str:
         """Save report to JSON file"""
-        if not filename:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"aws_rds_backup_report_{timestamp}.json"
+        filename = filename or self._default_report_filename()
         
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if orjson is not None:
+            # orjson encodes datetimes natively instead of a Python callback per value
+            data = orjson.dumps(
+                report,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_APPEND_NEWLINE
+            )
+            with open(filename, 'wb') as f:
+                f.write(data)
+        else:
+            with open(filename, 'w') as f:
+                json.dump(report, f, indent=2, default=str)
         
-        self.logger.info(f"Report saved to: {filename}")
+        self.logger.info("Report saved to: %s", filename)
         return filename
     
     def print_summary(self, report: Dict):
@@ -458,19 +977,153 @@ class AWSRDSBackupManager:
                   f"Backup Retention: {cluster['BackupRetentionPeriod']} days")
         
         print("\nRecent Manual Snapshots:")
-        all_snapshots = report['snapshots']['instances'] + report['snapshots']['clusters']
-        all_snapshots.sort(key=lambda x: x['SnapshotCreateTime'], reverse=True)
+        recent_snapshots = heapq.nlargest(
+            10,  # Show last 10
+            itertools.chain(report['snapshots']['instances'], report['snapshots']['clusters']),
+            key=itemgetter('SnapshotCreateTime')
+        )
         
-        for snapshot in all_snapshots[:10]:  # Show last 10
+        for snapshot in recent_snapshots:
             print(f"  {snapshot['SnapshotId']} ({snapshot['Type']}) - "
                   f"Created: {snapshot['SnapshotCreateTime']} - Status: {snapshot['Status']}")
 
 
+class AsyncAWSRDSBackupManager(AWSRDSBackupManager):
+    """Backup manager whose report path runs every RDS/CloudWatch call on one event loop"""
+    
+    def __init__(self, region: str = 'us-east-1', profile: Optional[str] = None, use_cache: bool = True):
+        if aioboto3 is None:
+            raise RuntimeError("aioboto3 is required for the async backup manager (pip install aioboto3)")
+        self.session = aioboto3.Session(profile_name=profile)
+        super().__init__(region=region, profile=profile, use_cache=use_cache)
+    
+    async def _paginate(self, client, operation: str, result_key: str, **params) -> List[Dict]:
+        """Collect all items of a describe call, following Marker and retrying throttled pages"""
+        method = getattr(client, operation)
+        params['MaxRecords'] = PAGE_SIZE
+        items = []
+        
+        while True:
+            for attempt in range(THROTTLE_MAX_ATTEMPTS + 1):
+                try:
+                    page = await method(**params)
+                    break
+                except ClientError as e:
+                    delay = self._throttle_delay(e, attempt)
+                    if delay is None:
+                        raise
+                    self.logger.warning("%s throttled, retrying page in %.1fs", operation, delay)
+                    await asyncio.sleep(delay)
+            
+            items.extend(page[result_key])
+            
+            if not page.get('Marker'):
+                return items
+            params['Marker'] = page['Marker']
+    
+    async def get_rds_instances_async(self, rds) -> List[Dict]:
+        """Get RDS instances"""
+        if self.use_cache:
+            cached = self._load_cached_describe('instances', ('LatestRestorableTime',))
+            if cached is not None:
+                return cached
+        try:
+            dbs = await self._paginate(rds, 'describe_db_instances', 'DBInstances')
+            instances = [self._instance_record(db) for db in dbs]
+        except ClientError as e:
+            self.logger.error("Failed to get RDS instances: %s", e)
+            return []
+        return self._store_cached_describe('instances', instances) if self.use_cache else instances
+    
+    async def get_aurora_clusters_async(self, rds) -> List[Dict]:
+        """Get Aurora clusters"""
+        if self.use_cache:
+            cached = self._load_cached_describe('clusters')
+            if cached is not None:
+                return cached
+        try:
+            clusters = await self._paginate(rds, 'describe_db_clusters', 'DBClusters')
+            clusters = [self._cluster_record(cluster) for cluster in clusters]
+        except ClientError as e:
+            self.logger.error("Failed to get Aurora clusters: %s", e)
+            return []
+        return self._store_cached_describe('clusters', clusters) if self.use_cache else clusters
+    
+    async def list_snapshots_async(self, rds, is_cluster: bool = False) -> List[Dict]:
+        """List manual snapshots"""
+        if self.snapshot_inventory is not None:
+            # --use-events: serve the same inventory the synchronous report reads
+            return self.list_snapshots(is_cluster=is_cluster)
+        
+        cfg = CLUSTER_SNAPSHOT_CFG if is_cluster else INSTANCE_SNAPSHOT_CFG
+        try:
+            snapshots = await self._paginate(rds, cfg['api'], cfg['resp_key'], SnapshotType='manual')
+            return [self._snapshot_record(snapshot, is_cluster) for snapshot in snapshots]
+        except ClientError as e:
+            self.logger.error("Failed to list snapshots: %s", e)
+            return []
+    
+    async def get_backup_metrics_bulk_async(self, cloudwatch,
+                                            identifiers: List[Tuple[str, bool]]) -> Dict[Tuple[str, bool], Dict]:
+        """Get backup-related CloudWatch metrics, one concurrent GetMetricData call per 500 resources"""
+        metrics_by_id = {key: {'SnapshotStorageUsed': None} for key in identifiers}
+        
+        end_time = datetime.datetime.now(datetime.timezone.utc)
+        start_time = end_time - datetime.timedelta(days=1)
+        queries, query_ids = self._metric_data_queries(identifiers)
+        
+        async def fetch(batch: List[Dict]):
+            async for page in cloudwatch.get_paginator('get_metric_data').paginate(
+                    MetricDataQueries=batch, StartTime=start_time, EndTime=end_time,
+                    ScanBy='TimestampDescending'):
+                self._apply_metric_results(page, query_ids, metrics_by_id)
+        
+        try:
+            await asyncio.gather(*(
+                fetch(queries[offset:offset + METRIC_DATA_MAX_QUERIES])
+                for offset in range(0, len(queries), METRIC_DATA_MAX_QUERIES)
+            ))
+        except ClientError as e:
+            self.logger.error("Failed to get backup metrics: %s", e)
+        
+        return metrics_by_id
+    
+    async def generate_backup_report_async(self) -> Dict:
+        """Generate comprehensive backup report with all API calls in flight concurrently"""
+        config = self.client_config
+        
+        if self.use_cache:
+            # cache_dir needs the account; resolve its blocking STS call off the event loop first
+            await asyncio.get_running_loop().run_in_executor(None, lambda: self.account_id)
+        
+        # Open each client once for the whole report rather than per call
+        async with self.session.client('rds', config=config) as rds, \
+                self.session.client('cloudwatch', config=config) as cloudwatch:
+            instances, clusters, instance_snapshots, cluster_snapshots = await asyncio.gather(
+                self.get_rds_instances_async(rds),
+                self.get_aurora_clusters_async(rds),
+                self.list_snapshots_async(rds, is_cluster=False),
+                self.list_snapshots_async(rds, is_cluster=True)
+            )
+            
+            metrics_by_id = await self.get_backup_metrics_bulk_async(
+                cloudwatch,
+                [(instance['DBInstanceIdentifier'], False) for instance in instances] +
+                [(cluster['DBClusterIdentifier'], True) for cluster in clusters]
+            )
+        
+        return self._build_report(instances, clusters, instance_snapshots, cluster_snapshots, metrics_by_id)
+    
+    def generate_backup_report(self) -> Dict:
+        """Generate comprehensive backup report"""
+        return asyncio.run(self.generate_backup_report_async())
+
+
 def main():
     parser = argparse.ArgumentParser(description='AWS RDS/Aurora Backup Management')
     parser.add_argument('--region', default='us-east-1', help='AWS region')
     parser.add_argument('--profile', help='AWS CLI profile to use')
-    parser.add_argument('--action', choices=['report', 'backup', 'cleanup', 'list'], 
+    parser.add_argument('--action', choices=['report', 'backup', 'cleanup', 'list', 'subscribe-events'], 
                        default='report', help='Action to perform')
     parser.add_argument('--identifier', help='RDS instance or Aurora cluster identifier')
     parser.add_argument('--snapshot-id', help='Snapshot identifier for backup action')
@@ -478,22 +1131,42 @@ def main():
     parser.add_argument('--retention-days', type=int, default=7, 
                        help='Retention period for cleanup action')
     parser.add_argument('--output-file', help='Output file for report')
+    parser.add_argument('--use-async', action='store_true',
+                       help='Generate the report with concurrent aioboto3 calls (requires aioboto3)')
+    parser.add_argument('--use-events', action='store_true',
+                       help='Serve snapshot listings from the event-driven local inventory')
+    parser.add_argument('--events-queue', default=EVENTS_QUEUE_NAME,
+                       help='SQS queue receiving RDS snapshot events')
+    parser.add_argument('--reconcile', action='store_true',
+                       help='Rebuild the local snapshot inventory from the describe APIs')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always describe instances and clusters instead of using the local cache')
     
     args = parser.parse_args()
     
     # Initialize backup manager
-    backup_manager = AWSRDSBackupManager(region=args.region, profile=args.profile)
+    if args.use_async:
+        backup_manager = AsyncAWSRDSBackupManager(region=args.region, profile=args.profile,
+                                                  use_cache=not args.no_cache)
+    else:
+        backup_manager = AWSRDSBackupManager(region=args.region, profile=args.profile,
+                                             use_cache=not args.no_cache)
     
     try:
+        if args.action in ('report', 'backup'):
+            backup_manager.validate_credentials()
+        
+        if args.use_events and args.action != 'subscribe-events':
+            backup_manager.sync_snapshot_inventory(args.events_queue, args.reconcile)
+        
         if args.action == 'report':
             # Generate comprehensive report
-            report = backup_manager.generate_backup_report()
-            backup_manager.print_summary(report)
-            
-            if args.output_file:
+            if args.use_async:
+                report = backup_manager.generate_backup_report()
                 backup_manager.save_report(report, args.output_file)
             else:
-                backup_manager.save_report(report)
+                report = backup_manager.write_backup_report(args.output_file)
+            backup_manager.print_summary(report)
         
         elif args.action == 'backup':
             if not args.identifier or not args.snapshot_id:
@@ -521,12 +1194,16 @@ def main():
             for snapshot in snapshots:
                 print(f"  {snapshot['SnapshotId']} ({snapshot['Type']}) - "
                       f"Source: {snapshot['SourceId']} - Status: {snapshot['Status']}")
+        
+        elif args.action == 'subscribe-events':
+            queue_url = backup_manager.subscribe_events(args.events_queue)
+            sys.exit(0 if queue_url else 1)
     
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
         sys.exit(1)
     except Exception as e:
-        backup_manager.logger.error(f"Unexpected error: {e}")
+        backup_manager.logger.error("Unexpected error: %s", e)
         sys.exit(1)
 
 
@@ -7,6 +7,7 @@ Purpose: Comprehensive Cassandra backup and snapshot management
 
 import os
 import sys
+import glob
 import json
 import time
 import shutil
@@ -14,23 +15,87 @@ import argparse
 import logging
 import datetime
 import subprocess
+import tempfile
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from cassandra.cluster import Cluster
 from cassandra.auth import PlainTextAuthProvider
 from cassandra.policies import DCAwareRoundRobinPolicy
 
+try:
+    import liburing
+except ImportError:  # optional, enables batched io_uring copies on Linux >= 5.6
+    liburing = None
+
+try:
+    import requests
+except ImportError:  # optional, only needed for --jolokia-url
+    requests = None
+
+try:
+    import orjson
+except ImportError:  # optional, faster manifest serialization
+    orjson = None
+
+# io_uring copy tuning: bytes per read/write pair and pairs kept in flight
+IO_URING_CHUNK_SIZE = 1024 * 1024
+IO_URING_DEPTH = 64
+# User data carried by the cancel requests issued when a copy is abandoned
+IO_URING_CANCEL_DATA = 2 ** 64 - 1
+
+# Seconds a tar | zstd snapshot archive may run before it is killed
+ARCHIVE_TIMEOUT = 6 * 3600
+
+# Threads used for the per-file copy when io_uring is not available
+COPY_MAX_WORKERS = 16
+
+# Threads used to read backup manifests when listing backups
+MANIFEST_MAX_WORKERS = 8
+
+# Upper bound on tables snapshotted and copied at once during a full backup
+SNAPSHOT_MAX_WORKERS = 8
+
+# Keyspaces managed by Cassandra itself, excluded from cluster info
+SYSTEM_KEYSPACES = frozenset({
+    'system', 'system_auth', 'system_schema', 'system_traces',
+    'system_distributed', 'system_views', 'system_virtual_schema'
+})
+
+# Multipliers for the human readable sizes printed by nodetool listsnapshots
+NODETOOL_SIZE_UNITS = {
+    'bytes': 1, 'B': 1,
+    'KB': 1024, 'KiB': 1024,
+    'MB': 1024 ** 2, 'MiB': 1024 ** 2,
+    'GB': 1024 ** 3, 'GiB': 1024 ** 3,
+    'TB': 1024 ** 4, 'TiB': 1024 ** 4
+}
+
+# StorageService MBean that nodetool wraps, reached over a Jolokia agent
+STORAGE_SERVICE_MBEAN = 'org.apache.cassandra.db:type=StorageService'
+
+# Units used by _format_bytes, one per power of 1024
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Seconds cluster and table metadata lookups are reused within a run
+SCHEMA_CACHE_TTL = 60
+
 class CassandraBackup:
     def __init__(self, hosts: List[str], keyspace: Optional[str] = None, 
                  username: Optional[str] = None, password: Optional[str] = None,
-                 port: int = 9042, datacenter: Optional[str] = None):
+                 port: int = 9042, datacenter: Optional[str] = None,
+                 jolokia_url: Optional[str] = None):
         self.hosts = hosts
         self.keyspace = keyspace
         self.username = username
         self.password = password
         self.port = port
         self.datacenter = datacenter
+        self._schema_cache: Dict[Tuple, Tuple[float, object]] = {}
         self.setup_logging()
+        self.setup_jolokia(jolokia_url)
         self.connect()
         
     def setup_logging(self):
@@ -45,6 +110,30 @@ class CassandraBackup:
         )
         self.logger = logging.getLogger(__name__)
     
+    def setup_jolokia(self, jolokia_url: Optional[str]):
+        """Use a Jolokia agent for snapshot operations instead of forking nodetool"""
+        self.jolokia_url = jolokia_url
+        self.jolokia = None
+        if jolokia_url:
+            if requests is None:
+                self.logger.error("The requests package is required for --jolokia-url")
+                sys.exit(1)
+            self.jolokia = requests.Session()
+            self.logger.info(f"Using Jolokia agent for snapshots: {jolokia_url}")
+    
+    def _jolokia_request(self, *operations: Dict) -> List:
+        """Send StorageService operations to Jolokia in one bulk request and return their values"""
+        payload = [dict(operation, mbean=STORAGE_SERVICE_MBEAN) for operation in operations]
+        response = self.jolokia.post(self.jolokia_url, json=payload, timeout=300)
+        response.raise_for_status()
+        
+        values = []
+        for item in response.json():
+            if item.get('status') != 200:
+                raise RuntimeError(item.get('error', 'Unknown Jolokia error'))
+            values.append(item.get('value'))
+        return values
+    
     def connect(self):
         """Connect to Cassandra cluster"""
         try:
@@ -81,12 +170,44 @@ class CassandraBackup:
             version = result.one().release_version
             self.logger.info(f"Cassandra version: {version}")
             
+            self.prepare_statements()
+            
         except Exception as e:
             self.logger.error(f"Failed to connect to Cassandra: {e}")
             sys.exit(1)
     
+    def prepare_statements(self):
+        """Prepare metadata queries once so later calls only send the statement id and bound values"""
+        self._cluster_name_stmt = self.session.prepare("SELECT cluster_name FROM system.local")
+        self._peers_stmt = self.session.prepare(
+            "SELECT peer, data_center, rack, release_version, tokens FROM system.peers"
+        )
+        self._local_stmt = self.session.prepare(
+            "SELECT data_center, rack, release_version, tokens FROM system.local"
+        )
+        self._tables_stmt = self.session.prepare(
+            "SELECT table_name, bloom_filter_fp_chance, caching, compaction, compression "
+            "FROM system_schema.tables WHERE keyspace_name = ?"
+        )
+    
+    def _cached(self, key: Tuple, loader):
+        """Return a cached metadata lookup, reloading it once SCHEMA_CACHE_TTL has passed"""
+        now = time.monotonic()
+        entry = self._schema_cache.get(key)
+        if entry and now - entry[0] < SCHEMA_CACHE_TTL:
+            return entry[1]
+        
+        value = loader()
+        if value:
+            self._schema_cache[key] = (now, value)
+        return value
+    
     def get_cluster_info(self) -> Dict:
         """Get cluster information"""
+        return self._cached(('cluster_info',), self._load_cluster_info)
+    
+    def _load_cluster_info(self) -> Dict:
+        """Query cluster information"""
         try:
             cluster_info = {
                 'hosts': [],
@@ -95,17 +216,16 @@ class CassandraBackup:
                 'cluster_name': 'Unknown'
             }
             
+            # Issue the independent queries together and wait on all of them
+            cluster_name_future = self.session.execute_async(self._cluster_name_stmt)
+            peers_future = self.session.execute_async(self._peers_stmt)
+            local_future = self.session.execute_async(self._local_stmt)
+            
             # Get cluster name
-            result = self.session.execute("SELECT cluster_name FROM system.local")
-            cluster_info['cluster_name'] = result.one().cluster_name
+            cluster_info['cluster_name'] = cluster_name_future.result().one().cluster_name
             
             # Get all hosts
-            result = self.session.execute("""
-                SELECT peer, data_center, rack, release_version, tokens 
-                FROM system.peers
-            """)
-            
-            for row in result:
+            for row in peers_future.result():
                 host_info = {
                     'peer': str(row.peer) if row.peer else 'Unknown',
                     'data_center': row.data_center,
@@ -122,11 +242,7 @@ class CassandraBackup:
                 cluster_info['datacenter_info'][dc] += 1
             
             # Add local host info
-            result = self.session.execute("""
-                SELECT data_center, rack, release_version, tokens 
-                FROM system.local
-            """)
-            local = result.one()
+            local = local_future.result().one()
             cluster_info['hosts'].append({
                 'peer': 'local',
                 'data_center': local.data_center,
@@ -140,20 +256,16 @@ class CassandraBackup:
                 cluster_info['datacenter_info'][local.data_center] = 0
             cluster_info['datacenter_info'][local.data_center] += 1
             
-            # Get keyspaces
-            result = self.session.execute("""
-                SELECT keyspace_name, strategy_class, strategy_options 
-                FROM system_schema.keyspaces
-            """)
-            
-            for row in result:
-                if not row.keyspace_name.startswith('system'):
-                    keyspace_info = {
-                        'name': row.keyspace_name,
-                        'strategy_class': row.strategy_class,
-                        'replication': row.strategy_options
-                    }
-                    cluster_info['keyspaces'].append(keyspace_info)
+            # Get keyspaces from the driver's schema metadata (kept current by the control connection)
+            keyspaces = self.cluster.metadata.keyspaces
+            for name in sorted(keyspaces.keys() - SYSTEM_KEYSPACES):
+                strategy = keyspaces[name].replication_strategy
+                keyspace_info = {
+                    'name': name,
+                    'strategy_class': type(strategy).__name__ if strategy else None,
+                    'replication': strategy.export_for_schema() if strategy else None
+                }
+                cluster_info['keyspaces'].append(keyspace_info)
             
             return cluster_info
             
@@ -163,12 +275,12 @@ class CassandraBackup:
     
     def get_keyspace_tables(self, keyspace: str) -> List[Dict]:
         """Get tables in keyspace"""
+        return self._cached(('tables', keyspace), lambda: self._load_keyspace_tables(keyspace))
+    
+    def _load_keyspace_tables(self, keyspace: str) -> List[Dict]:
+        """Query tables in keyspace"""
         try:
-            result = self.session.execute(f"""
-                SELECT table_name, bloom_filter_fp_chance, caching, compaction, compression
-                FROM system_schema.tables 
-                WHERE keyspace_name = '{keyspace}'
-            """)
+            result = self.session.execute(self._tables_stmt, (keyspace,))
             
             tables = []
             for row in result:
@@ -193,11 +305,36 @@ class CassandraBackup:
         try:
             self.logger.info(f"Creating snapshot: {snapshot_name}")
             
+            if self.jolokia:
+                # Take the snapshot and read its details in the same bulk request
+                entities = [f"{keyspace}.{table}" if table else keyspace] if keyspace else []
+                _, details = self._jolokia_request({
+                    'type': 'exec',
+                    'operation': 'takeSnapshot(java.lang.String,java.util.Map,[Ljava.lang.String;)',
+                    'arguments': [snapshot_name, {}, entities]
+                }, {'type': 'exec', 'operation': 'getSnapshotDetails()'})
+                self.logger.info(f"Snapshot created successfully: {snapshot_name}")
+                
+                snapshot_info = defaultdict(lambda: {
+                    'name': '',
+                    'tables': [],
+                    'total_size': 0,
+                    'total_true_size': 0
+                })
+                self._add_snapshot_details(snapshot_info, details, snapshot_name)
+                return {
+                    'status': 'success',
+                    'snapshot_name': snapshot_name,
+                    'created_at': datetime.datetime.now().isoformat(),
+                    'info': dict(snapshot_info)
+                }
+            
             # Build nodetool command
             cmd = ['nodetool', 'snapshot']
             
             if keyspace and table:
-                cmd.extend(['-t', snapshot_name, keyspace, table])
+                # Positional arguments are all keyspaces; the table goes through -cf
+                cmd.extend(['-t', snapshot_name, '-cf', table, keyspace])
                 self.logger.info(f"Creating snapshot for table {keyspace}.{table}")
             elif keyspace:
                 cmd.extend(['-t', snapshot_name, keyspace])
@@ -212,8 +349,8 @@ class CassandraBackup:
             if result.returncode == 0:
                 self.logger.info(f"Snapshot created successfully: {snapshot_name}")
                 
-                # Get snapshot info
-                snapshot_info = self.get_snapshot_info(snapshot_name)
+                # nodetool already reports what it snapshotted; no second listsnapshots call
+                snapshot_info = self._parse_snapshot_output(result.stdout)
                 return {
                     'status': 'success',
                     'snapshot_name': snapshot_name,
@@ -235,59 +372,136 @@ class CassandraBackup:
             self.logger.error(f"Snapshot creation failed: {e}")
             return {'status': 'error', 'error': str(e), 'snapshot_name': snapshot_name}
     
+    @staticmethod
+    def _parse_snapshot_output(output: str) -> Dict:
+        """Extract the keyspaces and snapshot directory reported by nodetool snapshot"""
+        snapshot_info = {}
+        for line in output.splitlines():
+            if line.startswith('Requested creating snapshot'):
+                keyspaces = line.partition('[')[2].partition(']')[0]
+                snapshot_info['keyspaces'] = [ks.strip() for ks in keyspaces.split(',') if ks.strip()]
+            elif line.startswith('Snapshot directory:'):
+                snapshot_info['snapshot_directory'] = line.partition(':')[2].strip()
+        return snapshot_info
+    
     def get_snapshot_info(self, snapshot_name: Optional[str] = None) -> Dict:
         """Get snapshot information"""
         try:
+            snapshots = defaultdict(lambda: {
+                'name': '',
+                'tables': [],
+                'total_size': 0,
+                'total_true_size': 0
+            })
+            
+            if self.jolokia:
+                details, = self._jolokia_request({'type': 'exec', 'operation': 'getSnapshotDetails()'})
+                self._add_snapshot_details(snapshots, details, snapshot_name)
+                return dict(snapshots)
+            
             cmd = ['nodetool', 'listsnapshots']
             if snapshot_name:
                 cmd.extend(['-t', snapshot_name])
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                # Parse nodetool output
-                lines = result.stdout.strip().split('\n')
-                snapshots = {}
+            # stderr goes to a temp file so it can never fill a pipe while stdout is streamed
+            with tempfile.TemporaryFile(mode='w+') as stderr_file, \
+                    subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True, bufsize=1) as proc:
+                timed_out = threading.Event()
                 
-                for line in lines[1:]:  # Skip header
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= 5:
-                            snap_name = parts[0]
-                            keyspace = parts[1]
-                            table = parts[2]
-                            size = parts[3]
-                            true_size = parts[4]
-                            
-                            if snap_name not in snapshots:
-                                snapshots[snap_name] = {
-                                    'name': snap_name,
-                                    'tables': [],
-                                    'total_size': 0,
-                                    'total_true_size': 0
-                                }
-                            
-                            snapshots[snap_name]['tables'].append({
-                                'keyspace': keyspace,
-                                'table': table,
-                                'size': size,
-                                'true_size': true_size
-                            })
+                def kill_nodetool():
+                    timed_out.set()
+                    proc.kill()
                 
-                return snapshots
-            else:
-                self.logger.error(f"Failed to get snapshot info: {result.stderr}")
+                # The watchdog bounds the whole run, including a nodetool that stops writing
+                watchdog = threading.Timer(60, kill_nodetool)
+                watchdog.start()
+                try:
+                    # Parse rows as nodetool prints them:
+                    # <snapshot> <keyspace> <table> <true size> <unit> <size on disk> <unit> ...
+                    for line in proc.stdout:
+                        parts = line.split(None, 7)
+                        if len(parts) < 7:
+                            continue
+                        try:
+                            true_size = self._parse_nodetool_size(parts[3], parts[4])
+                            size = self._parse_nodetool_size(parts[5], parts[6])
+                        except (ValueError, KeyError):
+                            continue  # header and summary lines
+                        
+                        self._add_snapshot_table(snapshots, parts[0], parts[1], parts[2], size, true_size)
+                    
+                    returncode = proc.wait()
+                finally:
+                    watchdog.cancel()
+                
+                stderr_file.seek(0)
+                stderr = stderr_file.read()
+            
+            if timed_out.is_set():
+                self.logger.error("Failed to get snapshot info: nodetool listsnapshots timed out")
+                return {}
+            if returncode != 0:
+                self.logger.error(f"Failed to get snapshot info: {stderr}")
                 return {}
+            
+            return dict(snapshots)
                 
         except Exception as e:
             self.logger.error(f"Failed to get snapshot info: {e}")
             return {}
     
+    @staticmethod
+    def _add_snapshot_table(snapshots: Dict, snap_name: str, keyspace: str, table: str,
+                            size: int, true_size: int):
+        """Record one snapshotted table and update the snapshot totals"""
+        snapshot = snapshots[snap_name]
+        snapshot['name'] = snap_name
+        snapshot['tables'].append({
+            'keyspace': keyspace,
+            'table': table,
+            'size': size,
+            'true_size': true_size
+        })
+        snapshot['total_size'] += size
+        snapshot['total_true_size'] += true_size
+    
+    def _add_snapshot_details(self, snapshots: Dict, details, snapshot_name: Optional[str] = None):
+        """Record the rows of StorageService.getSnapshotDetails as rendered by Jolokia"""
+        # Jolokia nests TabularData by its index columns, so descend until the row dicts
+        if isinstance(details, list):
+            for item in details:
+                self._add_snapshot_details(snapshots, item, snapshot_name)
+        elif isinstance(details, dict):
+            if 'Keyspace name' not in details:
+                for item in details.values():
+                    self._add_snapshot_details(snapshots, item, snapshot_name)
+            elif not snapshot_name or details['Snapshot name'] == snapshot_name:
+                self._add_snapshot_table(
+                    snapshots, details['Snapshot name'], details['Keyspace name'],
+                    details['Column family name'],
+                    self._parse_nodetool_size(*details['Size on disk'].split()),
+                    self._parse_nodetool_size(*details['True size'].split())
+                )
+    
+    @staticmethod
+    def _parse_nodetool_size(value: str, unit: str) -> int:
+        """Convert a nodetool size such as '13.43 KiB' to bytes"""
+        return int(float(value) * NODETOOL_SIZE_UNITS[unit])
+    
     def clear_snapshot(self, snapshot_name: str, keyspace: Optional[str] = None) -> bool:
         """Clear/delete snapshot"""
         try:
             self.logger.info(f"Clearing snapshot: {snapshot_name}")
             
+            if self.jolokia:
+                self._jolokia_request({
+                    'type': 'exec',
+                    'operation': 'clearSnapshot(java.lang.String,[Ljava.lang.String;)',
+                    'arguments': [snapshot_name, [keyspace] if keyspace else []]
+                })
+                self.logger.info(f"Snapshot cleared successfully: {snapshot_name}")
+                return True
+            
             cmd = ['nodetool', 'clearsnapshot']
             if keyspace:
                 cmd.extend(['-t', snapshot_name, keyspace])
@@ -334,17 +548,43 @@ class CassandraBackup:
             else:
                 cmd.extend(['-e', 'DESCRIBE SCHEMA;'])
             
-            # Execute and save output
-            with open(output_path, 'w') as f:
-                result = subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, 
-                                      text=True, timeout=300)
+            # Execute and save output, compressed on the fly when zstd is available
+            if shutil.which('zstd'):
+                output_path = f"{output_path}.zst"
+                processes = []
+                # cqlsh's stderr goes to a temp file so its warnings can't fill a pipe and stall the dump
+                with tempfile.TemporaryFile() as cqlsh_stderr:
+                    try:
+                        cqlsh = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=cqlsh_stderr)
+                        processes.append(cqlsh)
+                        zstd = subprocess.Popen(['zstd', '-3', '-q', '-f', '-o', output_path],
+                                                stdin=cqlsh.stdout, stderr=subprocess.PIPE)
+                        processes.append(zstd)
+                        cqlsh.stdout.close()  # zstd owns the pipe now
+                        _, zstd_err = zstd.communicate(timeout=300)
+                        cqlsh.wait()
+                    finally:
+                        # On a timeout neither child may still be running once we return
+                        self._reap_processes(*processes)
+                    
+                    cqlsh_stderr.seek(0)
+                    cqlsh_err = cqlsh_stderr.read()
+                
+                returncode = cqlsh.returncode or zstd.returncode
+                error = (cqlsh_err or zstd_err).decode()
+            else:
+                with open(output_path, 'w') as f:
+                    result = subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, 
+                                          text=True, timeout=300)
+                returncode = result.returncode
+                error = result.stderr
             
-            if result.returncode == 0:
+            if returncode == 0:
                 schema_size = os.path.getsize(output_path)
                 self.logger.info(f"Schema backup completed: {self._format_bytes(schema_size)}")
                 return True
             else:
-                self.logger.error(f"Schema backup failed: {result.stderr}")
+                self.logger.error(f"Schema backup failed: {error}")
                 return False
                 
         except Exception as e:
@@ -352,7 +592,7 @@ class CassandraBackup:
             return False
     
     def copy_snapshot_data(self, snapshot_name: str, destination_dir: str,
-                          keyspace: Optional[str] = None) -> bool:
+                          keyspace: Optional[str] = None, table: Optional[str] = None) -> bool:
         """Copy snapshot data to backup location"""
         try:
             self.logger.info(f"Copying snapshot data: {snapshot_name}")
@@ -360,57 +600,32 @@ class CassandraBackup:
             # Create destination directory
             Path(destination_dir).mkdir(parents=True, exist_ok=True)
             
-            # Find Cassandra data directory (common locations)
-            data_dirs = [
-                '/var/lib/cassandra/data',
-                '/opt/cassandra/data',
-                '/data/cassandra/data',
-                os.path.expanduser('~/cassandra/data')
-            ]
-            
-            cassandra_data_dir = None
-            for data_dir in data_dirs:
-                if os.path.exists(data_dir):
-                    cassandra_data_dir = data_dir
-                    break
-            
+            cassandra_data_dir = self._find_data_dir()
             if not cassandra_data_dir:
-                self.logger.error("Could not find Cassandra data directory")
                 return False
             
-            self.logger.info(f"Using Cassandra data directory: {cassandra_data_dir}")
+            # Collect snapshot files up front so they can be copied as one batch
+            copy_list = []
             
-            # Copy snapshot files
-            copied_files = 0
-            total_size = 0
+            needed_dirs = set()
             
-            # Walk through data directory looking for snapshots
-            for root, dirs, files in os.walk(cassandra_data_dir):
-                if 'snapshots' in root and snapshot_name in root:
-                    # This is a snapshot directory
+            # Walk only the snapshot directories (and any index subdirectories inside them)
+            for snapshot_dir in self._find_snapshot_dirs(cassandra_data_dir, snapshot_name, keyspace, table):
+                for root, dirs, files in os.walk(snapshot_dir):
                     rel_path = os.path.relpath(root, cassandra_data_dir)
                     dest_path = os.path.join(destination_dir, rel_path)
+                    needed_dirs.add(dest_path)
                     
-                    # Create destination directory structure
-                    Path(dest_path).mkdir(parents=True, exist_ok=True)
-                    
-                    # Copy files
                     for file in files:
                         src_file = os.path.join(root, file)
-                        dest_file = os.path.join(dest_path, file)
-                        
-                        # Filter by keyspace if specified
-                        if keyspace and keyspace not in root:
-                            continue
-                        
-                        try:
-                            shutil.copy2(src_file, dest_file)
-                            file_size = os.path.getsize(dest_file)
-                            total_size += file_size
-                            copied_files += 1
-                            
-                        except Exception as e:
-                            self.logger.error(f"Failed to copy {src_file}: {e}")
+                        # Stat the source once; its size is reused for the copy and the totals
+                        copy_list.append((src_file, os.path.join(dest_path, file), os.stat(src_file).st_size))
+            
+            # Create destination directory structure once, parents first, before any copy starts
+            for dest_path in sorted(needed_dirs, key=len):
+                Path(dest_path).mkdir(parents=True, exist_ok=True)
+            
+            copied_files, total_size = self._copy_files(copy_list)
             
             if copied_files > 0:
                 self.logger.info(f"Copied {copied_files} files ({self._format_bytes(total_size)})")
@@ -423,7 +638,323 @@ class CassandraBackup:
             self.logger.error(f"Failed to copy snapshot data: {e}")
             return False
     
-    def create_full_backup(self, backup_dir: str, backup_name: Optional[str] = None) -> Dict:
+    def archive_snapshot_data(self, snapshot_name: str, archive_path: str,
+                              keyspace: Optional[str] = None, table: Optional[str] = None) -> bool:
+        """Stream snapshot data through tar | zstd into a single compressed archive"""
+        try:
+            self.logger.info(f"Archiving snapshot data: {snapshot_name}")
+            
+            if not shutil.which('zstd'):
+                self.logger.error("zstd is required to archive snapshot data")
+                return False
+            
+            cassandra_data_dir = self._find_data_dir()
+            if not cassandra_data_dir:
+                return False
+            
+            # tar recurses into each snapshot directory on its own
+            snapshot_dirs = [
+                os.path.relpath(snapshot_dir, cassandra_data_dir)
+                for snapshot_dir in self._find_snapshot_dirs(cassandra_data_dir, snapshot_name, keyspace, table)
+            ]
+            
+            if not snapshot_dirs:
+                self.logger.warning("No snapshot files found to archive")
+                return False
+            
+            Path(archive_path).parent.mkdir(parents=True, exist_ok=True)
+            
+            # --long=27 lets zstd match across SSTables; restore with zstd -d --long=27
+            processes = []
+            # tar's warnings (e.g. "file changed as we read it" on a live node) go to a temp file,
+            # so a full stderr pipe can never stall tar while zstd waits on its output
+            with tempfile.TemporaryFile() as tar_stderr:
+                try:
+                    tar = subprocess.Popen(['tar', '-C', cassandra_data_dir, '-cf', '-', *snapshot_dirs],
+                                           stdout=subprocess.PIPE, stderr=tar_stderr)
+                    processes.append(tar)
+                    zstd = subprocess.Popen(['zstd', '-T0', '-3', '--long=27', '-q', '-f', '-o', archive_path],
+                                            stdin=tar.stdout, stderr=subprocess.PIPE)
+                    processes.append(zstd)
+                    tar.stdout.close()  # zstd owns the pipe now
+                    _, zstd_err = zstd.communicate(timeout=ARCHIVE_TIMEOUT)
+                    tar.wait()
+                finally:
+                    self._reap_processes(*processes)
+                
+                tar_stderr.seek(0)
+                tar_err = tar_stderr.read()
+            
+            if tar.returncode != 0 or zstd.returncode != 0:
+                self.logger.error(f"Snapshot archive failed: {(tar_err or zstd_err).decode().strip()}")
+                return False
+            
+            archive_size = os.path.getsize(archive_path)
+            self.logger.info(f"Archived {len(snapshot_dirs)} snapshot directories ({self._format_bytes(archive_size)})")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to archive snapshot data: {e}")
+            return False
+    
+    @staticmethod
+    def _reap_processes(*processes: subprocess.Popen):
+        """Kill and wait for any pipeline stage still running, e.g. after a timeout or error"""
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+    
+    def _find_data_dir(self) -> Optional[str]:
+        """Locate the Cassandra data directory"""
+        # Find Cassandra data directory (common locations)
+        data_dirs = [
+            '/var/lib/cassandra/data',
+            '/opt/cassandra/data',
+            '/data/cassandra/data',
+            os.path.expanduser('~/cassandra/data')
+        ]
+        
+        for data_dir in data_dirs:
+            if os.path.exists(data_dir):
+                self.logger.info(f"Using Cassandra data directory: {data_dir}")
+                return data_dir
+        
+        self.logger.error("Could not find Cassandra data directory")
+        return None
+    
+    @staticmethod
+    def _find_snapshot_dirs(cassandra_data_dir: str, snapshot_name: str,
+                            keyspace: Optional[str] = None, table: Optional[str] = None) -> List[str]:
+        """Glob <keyspace>/<table>-<id>/snapshots/<name> directly instead of walking the data tree"""
+        keyspace_pattern = glob.escape(keyspace) if keyspace else '*'
+        table_pattern = f"{glob.escape(table)}-*" if table else '*'
+        pattern = f"{keyspace_pattern}/{table_pattern}/snapshots/{glob.escape(snapshot_name)}"
+        return [str(path) for path in Path(cassandra_data_dir).glob(pattern) if path.is_dir()]
+    
+    def _transfer_snapshot(self, snapshot_name: str, data_dir: str, keyspace: Optional[str] = None,
+                           table: Optional[str] = None, compress: bool = False) -> bool:
+        """Copy snapshot files into data_dir, or archive them there when compress is set"""
+        if compress:
+            archive_name = '.'.join(filter(None, [keyspace, table])) or 'cluster'
+            return self.archive_snapshot_data(snapshot_name, os.path.join(data_dir, f"{archive_name}.tar.zst"),
+                                              keyspace, table)
+        return self.copy_snapshot_data(snapshot_name, data_dir, keyspace, table)
+    
+    def _copy_files(self, copy_list: List[Tuple[str, str, int]]) -> Tuple[int, int]:
+        """Copy (src, dest, size) files, returning (copied_files, total_size)"""
+        if liburing is not None:
+            try:
+                return self._copy_files_io_uring(copy_list)
+            except OSError as e:
+                self.logger.warning(f"io_uring copy unavailable, falling back to threaded copy: {e}")
+        
+        copied_files = 0
+        total_size = 0
+        with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as executor:
+            futures = {executor.submit(self._copy_one, src_file, dest_file, size): src_file
+                       for src_file, dest_file, size in copy_list}
+            for future in as_completed(futures):
+                try:
+                    total_size += future.result()
+                    copied_files += 1
+                    
+                except Exception as e:
+                    self.logger.error(f"Failed to copy {futures[future]}: {e}")
+        
+        return copied_files, total_size
+    
+    @staticmethod
+    def _copy_one(src_file: str, dest_file: str, size: int) -> int:
+        """Copy one file of known size with sendfile (in-kernel, no userspace buffer)"""
+        if not hasattr(os, 'sendfile'):
+            shutil.copy2(src_file, dest_file)
+            return size
+        
+        src_fd = os.open(src_file, os.O_RDONLY)
+        try:
+            CassandraBackup._advise_sequential(src_fd)
+            dst_fd = os.open(dest_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                CassandraBackup._drop_cached_pages(src_fd, dst_fd)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        
+        shutil.copystat(src_file, dest_file)
+        return size
+    
+    def _copy_files_io_uring(self, copy_list: List[Tuple[str, str, int]]) -> Tuple[int, int]:
+        """Copy files through a single io_uring with many linked read->write pairs in flight"""
+        ring = liburing.io_uring()
+        cqe = liburing.io_uring_cqe()
+        liburing.io_uring_queue_init(IO_URING_DEPTH * 2, ring, 0)
+        
+        stats = {'files': 0, 'bytes': 0}
+        open_files = {}  # file index -> [src_fd, dst_fd, outstanding completions]
+        operations = {}  # user data -> [file index, buffer, length, outstanding completions]
+        
+        def finish(index: int):
+            src_fd, dst_fd, _ = open_files.pop(index)
+            CassandraBackup._drop_cached_pages(src_fd, dst_fd)
+            os.close(src_fd)
+            os.close(dst_fd)
+            src_file, dest_file, size = copy_list[index]
+            shutil.copystat(src_file, dest_file)
+            stats['files'] += 1
+            stats['bytes'] += size
+        
+        def chunks():
+            for index, (src_file, dest_file, size) in enumerate(copy_list):
+                src_fd = os.open(src_file, os.O_RDONLY)
+                dst_fd = os.open(dest_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                CassandraBackup._advise_sequential(src_fd)
+                open_files[index] = [src_fd, dst_fd, 2 * -(-size // IO_URING_CHUNK_SIZE)]
+                if size == 0:
+                    finish(index)
+                    continue
+                for offset in range(0, size, IO_URING_CHUNK_SIZE):
+                    yield index, src_fd, dst_fd, offset, min(IO_URING_CHUNK_SIZE, size - offset)
+        
+        try:
+            work = chunks()
+            exhausted = False
+            next_id = 0
+            
+            while True:
+                queued = False
+                while not exhausted and len(operations) < IO_URING_DEPTH:
+                    item = next(work, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, src_fd, dst_fd, offset, length = item
+                    buffer = bytearray(length)
+                    
+                    # The write only starts once the linked read has filled the buffer
+                    read_sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_read(read_sqe, src_fd, buffer, length, offset)
+                    liburing.io_uring_sqe_set_flags(read_sqe, liburing.IOSQE_IO_LINK)
+                    liburing.io_uring_sqe_set_data64(read_sqe, next_id)
+                    
+                    write_sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_write(write_sqe, dst_fd, buffer, length, offset)
+                    liburing.io_uring_sqe_set_data64(write_sqe, next_id)
+                    
+                    operations[next_id] = [index, buffer, length, 2]
+                    next_id += 1
+                    queued = True
+                
+                if not operations:
+                    break
+                if queued:
+                    liburing.io_uring_submit(ring)
+                
+                liburing.io_uring_wait_cqe(ring, cqe)
+                op_id = liburing.io_uring_cqe_get_data64(cqe)
+                result = cqe.res
+                liburing.io_uring_cqe_seen(ring, cqe)
+                
+                # Account for the completion before any error so the drain below waits for the right count
+                operation = operations[op_id]
+                operation[3] -= 1
+                if operation[3] == 0:
+                    del operations[op_id]
+                
+                if result != operation[2]:
+                    src_file = copy_list[operation[0]][0]
+                    if result < 0:
+                        raise OSError(-result, os.strerror(-result), src_file)
+                    raise OSError(f"Short transfer copying {src_file}: {result} of {operation[2]} bytes")
+                
+                open_files[operation[0]][2] -= 1
+                if open_files[operation[0]][2] == 0:
+                    finish(operation[0])
+            
+            return stats['files'], stats['bytes']
+            
+        finally:
+            # The kernel may still be reading into or writing from the buffers; settle every op first
+            self._drain_io_uring(ring, cqe, operations)
+            liburing.io_uring_queue_exit(ring)
+            for src_fd, dst_fd, _ in open_files.values():
+                os.close(src_fd)
+                os.close(dst_fd)
+    
+    @staticmethod
+    def _drain_io_uring(ring, cqe, operations: Dict[int, list]):
+        """Cancel and reap every read/write still in flight on an abandoned copy"""
+        pending = sum(operation[3] for operation in operations.values())
+        if not pending:
+            return
+        
+        # Flush anything prepared but not yet submitted so the SQ has room for the cancels
+        liburing.io_uring_submit(ring)
+        for op_id in operations:
+            # Cancelling a linked read also fails its write with -ECANCELED
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_cancel64(sqe, op_id, 0)
+            liburing.io_uring_sqe_set_data64(sqe, IO_URING_CANCEL_DATA)
+            pending += 1
+        liburing.io_uring_submit(ring)
+        
+        # Ops already executing can't be cancelled; their completions are simply waited for
+        while pending:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            liburing.io_uring_cqe_seen(ring, cqe)
+            pending -= 1
+    
+    def _backup_table(self, snapshot_name: str, keyspace: str, table: str, data_dir: str,
+                      compress: bool = False) -> Dict:
+        """Snapshot, copy and clear a single table"""
+        # Per-table tag so clearing one table never removes a snapshot still being copied
+        table_snapshot = f"{snapshot_name}_{table}"
+        table_result = {
+            'snapshot_name': table_snapshot,
+            'snapshot_created': False,
+            'data_copied': False,
+            'errors': []
+        }
+        
+        snapshot_result = self.create_snapshot(table_snapshot, keyspace, table)
+        if snapshot_result['status'] != 'success':
+            table_result['errors'].append(f"Snapshot creation failed: {snapshot_result.get('error', 'Unknown error')}")
+            return table_result
+        
+        table_result['snapshot_created'] = True
+        
+        if self._transfer_snapshot(table_snapshot, data_dir, keyspace, table, compress):
+            table_result['data_copied'] = True
+        else:
+            table_result['errors'].append('Data copy failed')
+        
+        if self.clear_snapshot(table_snapshot, keyspace):
+            self.logger.info(f"Temporary snapshot cleaned up for {keyspace}.{table}")
+        
+        return table_result
+    
+    @staticmethod
+    def _advise_sequential(fd: int):
+        """Ask the kernel for aggressive readahead on a file read front to back"""
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    
+    @staticmethod
+    def _drop_cached_pages(*fds: int):
+        """Drop copied pages from the page cache so backups don't evict Cassandra's working set"""
+        if hasattr(os, 'posix_fadvise'):
+            for fd in fds:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    
+    def create_full_backup(self, backup_dir: str, backup_name: Optional[str] = None,
+                           compress: bool = False) -> Dict:
         """Create full backup including schema and data snapshots"""
         try:
             if not backup_name:
@@ -441,6 +972,7 @@ class CassandraBackup:
                 'schema_backup': False,
                 'snapshot_created': False,
                 'data_copied': False,
+                'compressed': compress,
                 'cluster_info': {},
                 'errors': []
             }
@@ -457,32 +989,55 @@ class CassandraBackup:
             
             # Create snapshot
             snapshot_name = f"backup_snap_{int(time.time())}"
-            snapshot_result = self.create_snapshot(snapshot_name, self.keyspace)
+            data_dir = os.path.join(backup_path, 'data')
+            tables = self.get_keyspace_tables(self.keyspace) if self.keyspace else []
             
-            if snapshot_result['status'] == 'success':
-                backup_result['snapshot_created'] = True
+            if tables:
+                # Snapshot and copy tables concurrently with a bounded worker pool
+                Path(data_dir).mkdir(parents=True, exist_ok=True)
                 backup_result['snapshot_name'] = snapshot_name
+                backup_result['tables'] = {}
                 
-                # Copy snapshot data
-                data_dir = os.path.join(backup_path, 'data')
-                if self.copy_snapshot_data(snapshot_name, data_dir, self.keyspace):
-                    backup_result['data_copied'] = True
-                else:
-                    backup_result['errors'].append('Data copy failed')
+                with ThreadPoolExecutor(max_workers=min(SNAPSHOT_MAX_WORKERS, len(tables))) as executor:
+                    futures = {
+                        executor.submit(self._backup_table, snapshot_name, self.keyspace,
+                                        table['name'], data_dir, compress): table['name']
+                        for table in tables
+                    }
+                    for future in as_completed(futures):
+                        backup_result['tables'][futures[future]] = future.result()
                 
-                # Clean up snapshot after copying
-                if self.clear_snapshot(snapshot_name, self.keyspace):
-                    self.logger.info("Temporary snapshot cleaned up")
+                table_results = backup_result['tables']
+                backup_result['snapshot_created'] = all(r['snapshot_created'] for r in table_results.values())
+                backup_result['data_copied'] = all(r['data_copied'] for r in table_results.values())
+                for table_name, table_result in table_results.items():
+                    backup_result['errors'].extend(f"{table_name}: {error}" for error in table_result['errors'])
                 
             else:
-                backup_result['errors'].append(f"Snapshot creation failed: {snapshot_result.get('error', 'Unknown error')}")
+                snapshot_result = self.create_snapshot(snapshot_name, self.keyspace)
+                
+                if snapshot_result['status'] == 'success':
+                    backup_result['snapshot_created'] = True
+                    backup_result['snapshot_name'] = snapshot_name
+                    
+                    # Copy snapshot data
+                    if self._transfer_snapshot(snapshot_name, data_dir, self.keyspace, compress=compress):
+                        backup_result['data_copied'] = True
+                    else:
+                        backup_result['errors'].append('Data copy failed')
+                    
+                    # Clean up snapshot after copying
+                    if self.clear_snapshot(snapshot_name, self.keyspace):
+                        self.logger.info("Temporary snapshot cleaned up")
+                    
+                else:
+                    backup_result['errors'].append(f"Snapshot creation failed: {snapshot_result.get('error', 'Unknown error')}")
             
             # Create backup manifest
             manifest_file = os.path.join(backup_path, 'manifest.json')
             backup_result['completed_at'] = datetime.datetime.now().isoformat()
             
-            with open(manifest_file, 'w') as f:
-                json.dump(backup_result, f, indent=2)
+            self._write_manifest(manifest_file, backup_result)
             
             # Determine overall status
             if backup_result['schema_backup'] and backup_result['data_copied']:
@@ -502,50 +1057,30 @@ class CassandraBackup:
                 'backup_name': backup_name if 'backup_name' in locals() else 'Unknown'
             }
     
+    @staticmethod
+    def _write_manifest(manifest_file: str, manifest: Dict):
+        """Write a backup manifest as indented JSON"""
+        if orjson is not None:
+            with open(manifest_file, 'wb') as f:
+                f.write(orjson.dumps(manifest, default=str,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(manifest_file, 'w') as f:
+                json.dump(manifest, f, indent=2, default=str)
+    
     def list_backups(self, backup_dir: str) -> List[Dict]:
         """List available backups"""
         try:
-            backups = []
-            
             if not os.path.exists(backup_dir):
-                return backups
+                return []
             
-            for item in os.listdir(backup_dir):
-                item_path = os.path.join(backup_dir, item)
-                if os.path.isdir(item_path):
-                    manifest_file = os.path.join(item_path, 'manifest.json')
-                    
-                    if os.path.exists(manifest_file):
-                        try:
-                            with open(manifest_file, 'r') as f:
-                                manifest = json.load(f)
-                            
-                            backup_info = {
-                                'name': item,
-                                'path': item_path,
-                                'status': manifest.get('status', 'Unknown'),
-                                'created_at': manifest.get('started_at', 'Unknown'),
-                                'size': self._get_directory_size(item_path),
-                                'has_schema': os.path.exists(os.path.join(item_path, 'schema.cql')),
-                                'has_data': os.path.exists(os.path.join(item_path, 'data'))
-                            }
-                            
-                            backups.append(backup_info)
-                            
-                        except json.JSONDecodeError:
-                            self.logger.warning(f"Invalid manifest file: {manifest_file}")
-                    else:
-                        # Directory without manifest - might be an old backup
-                        backup_info = {
-                            'name': item,
-                            'path': item_path,
-                            'status': 'Unknown',
-                            'created_at': 'Unknown',
-                            'size': self._get_directory_size(item_path),
-                            'has_schema': os.path.exists(os.path.join(item_path, 'schema.cql')),
-                            'has_data': os.path.exists(os.path.join(item_path, 'data'))
-                        }
-                        backups.append(backup_info)
+            with os.scandir(backup_dir) as entries:
+                backup_dirs = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+            
+            # Each worker reads one manifest and sizes that backup's directory
+            with ThreadPoolExecutor(max_workers=MANIFEST_MAX_WORKERS) as executor:
+                backups = [info for info in executor.map(lambda item: self._load_backup_info(*item), backup_dirs)
+                           if info is not None]
             
             # Sort by creation time
             backups.sort(key=lambda x: x['created_at'], reverse=True)
@@ -555,20 +1090,54 @@ class CassandraBackup:
             self.logger.error(f"Failed to list backups: {e}")
             return []
     
+    def _load_backup_info(self, name: str, path: str) -> Optional[Dict]:
+        """Build the listing entry for one backup directory"""
+        manifest = {}
+        manifest_file = os.path.join(path, 'manifest.json')
+        
+        if os.path.exists(manifest_file):
+            try:
+                if orjson is not None:
+                    with open(manifest_file, 'rb') as f:
+                        manifest = orjson.loads(f.read())
+                else:
+                    with open(manifest_file, 'r') as f:
+                        manifest = json.load(f)
+                
+            except json.JSONDecodeError:
+                self.logger.warning(f"Invalid manifest file: {manifest_file}")
+                return None
+        
+        # Directories without manifest might be old backups
+        return {
+            'name': name,
+            'path': path,
+            'status': manifest.get('status', 'Unknown'),
+            'created_at': manifest.get('started_at', 'Unknown'),
+            'size': self._get_directory_size(path),
+            'has_schema': self._has_schema(path),
+            'has_data': os.path.exists(os.path.join(path, 'data'))
+        }
+    
+    @staticmethod
+    def _has_schema(backup_path: str) -> bool:
+        """Check for a schema dump, compressed or plain"""
+        return any(os.path.exists(os.path.join(backup_path, name))
+                   for name in ('schema.cql.zst', 'schema.cql'))
+    
     def cleanup_old_backups(self, backup_dir: str, retention_days: int) -> int:
         """Clean up old backups based on retention policy"""
         try:
-            cutoff_date = datetime.datetime.now() - datetime.timedelta(days=retention_days)
+            # started_at is written with isoformat(), so ISO strings compare chronologically
+            cutoff = (datetime.datetime.now() - datetime.timedelta(days=retention_days)).isoformat()
             deleted_count = 0
             
             backups = self.list_backups(backup_dir)
             
             for backup in backups:
                 try:
-                    # Parse creation date
                     if backup['created_at'] != 'Unknown':
-                        backup_date = datetime.datetime.fromisoformat(backup['created_at'].replace('Z', '+00:00'))
-                        if backup_date.replace(tzinfo=None) < cutoff_date:
+                        if backup['created_at'] < cutoff:
                             # Delete old backup
                             shutil.rmtree(backup['path'])
                             self.logger.info(f"Deleted old backup: {backup['name']}")
@@ -583,31 +1152,35 @@ class CassandraBackup:
             self.logger.error(f"Backup cleanup failed: {e}")
             return 0
     
+    @staticmethod
+    def _iter_file_sizes(path: str):
+        """Yield file sizes under path using the stat cached on each scandir entry"""
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from CassandraBackup._iter_file_sizes(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.stat(follow_symlinks=False).st_size
+    
     def _get_directory_size(self, path: str) -> str:
         """Get directory size in human readable format"""
         try:
-            total_size = 0
-            for dirpath, dirnames, filenames in os.walk(path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    if os.path.exists(filepath):
-                        total_size += os.path.getsize(filepath)
-            return self._format_bytes(total_size)
+            return self._format_bytes(sum(self._iter_file_sizes(path)))
         except:
             return "Unknown"
     
     def _format_bytes(self, bytes_size: int) -> str:
         """Format byte size to human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} PB"
+        # Each unit is 10 bits wide, so the bit length picks the unit without dividing
+        index = min((int(bytes_size).bit_length() - 1) // 10, len(BYTE_UNITS) - 1) if bytes_size > 0 else 0
+        return f"{bytes_size / (1 << (10 * index)):.1f} {BYTE_UNITS[index]}"
     
     def close(self):
         """Close Cassandra connection"""
         if hasattr(self, 'cluster') and self.cluster:
             self.cluster.shutdown()
+        if getattr(self, 'jolokia', None):
+            self.jolokia.close()
 
 def main():
     parser = argparse.ArgumentParser(description='Cassandra Backup Management Tool')
@@ -626,6 +1199,10 @@ def main():
                        help='Backup retention in days')
     parser.add_argument('--backup-name', help='Custom backup name')
     parser.add_argument('--snapshot-name', help='Snapshot name for snapshot operations')
+    parser.add_argument('--jolokia-url',
+                       help='Jolokia agent URL (e.g. http://localhost:8778/jolokia/) used instead of nodetool')
+    parser.add_argument('--compress', action='store_true',
+                       help='Store snapshot data as tar.zst archives instead of plain file copies')
     
     args = parser.parse_args()
     
@@ -636,12 +1213,13 @@ def main():
         username=args.username,
         password=args.password,
         port=args.port,
-        datacenter=args.datacenter
+        datacenter=args.datacenter,
+        jolokia_url=args.jolokia_url
     )
     
     try:
         if args.action == 'backup':
-            result = backup_manager.create_full_backup(args.backup_dir, args.backup_name)
+            result = backup_manager.create_full_backup(args.backup_dir, args.backup_name, args.compress)
             print(f"Backup Status: {result.get('status', 'Unknown')}")
             if result.get('errors'):
                 print(f"Errors: {result['errors']}")
@@ -683,7 +1261,7 @@ def main():
             
             print(f"\nKeyspaces:")
             for ks in cluster_info.get('keyspaces', []):
-                print(f"  - {ks['name']} ({ks.get('strategy_class', 'Unknown strategy')})")
+                print(f"  - {ks['name']} ({ks.get('strategy_class') or 'Unknown strategy'})")
     
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
@@ -7,15 +7,85 @@ Purpose: Comprehensive Elasticsearch cluster management and backup
 
 import os
 import sys
+import heapq
 import json
+import math
 import time
 import argparse
+import asyncio
 import logging
+import logging.handlers
 import datetime
 import requests
-from typing import Dict, List, Optional, Any
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional, faster parsing of large cluster responses
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:  # optional, only needed for AsyncElasticsearchManager
+    aiohttp = None
+
+try:
+    import ijson
+except ImportError:  # optional, streams large _stats responses instead of loading them whole
+    ijson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    _json_dumps = lambda value: json.dumps(value).encode()
+
+# Units used by _format_bytes, one per power of 1024
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# filter_path values for the larger metadata responses
+CLUSTER_HEALTH_FILTER = ('status,number_of_nodes,number_of_data_nodes,active_primary_shards,'
+                         'active_shards,relocating_shards,initializing_shards,unassigned_shards')
+SNAPSHOT_LIST_FILTER = ('snapshots.snapshot,snapshots.state,snapshots.start_time,snapshots.start_time_in_millis,'
+                        'snapshots.end_time,snapshots.duration_in_millis,snapshots.indices,snapshots.shards,'
+                        'snapshots.size_in_bytes')
+
+# Endpoints (with their filter_path) behind the cluster info summary
+CLUSTER_INFO_ENDPOINTS = {
+    '/': {'filter_path': 'cluster_name,version.number'},
+    '/_cluster/health': {'filter_path': CLUSTER_HEALTH_FILTER},
+    '/_cluster/stats': {'filter_path': 'indices.count,indices.docs.count,indices.store.size_in_bytes'},
+    '/_nodes': {'filter_path': 'nodes.*.name,nodes.*.roles,nodes.*.version'}
+}
+
+# Compact _cat/indices columns used for the default index listing
+CAT_INDICES_PARAMS = {
+    'format': 'json',
+    'bytes': 'b',
+    'h': 'index,health,status,pri,rep,docs.count,docs.deleted,store.size,creation.date'
+}
+
+# Compact _cat/snapshots columns used for the default snapshot listing
+CAT_SNAPSHOTS_PARAMS = {
+    'format': 'json',
+    'time': 'ms',
+    'h': 'id,status,start_epoch,end_epoch,duration,indices,total_shards,successful_shards,failed_shards'
+}
+
+# Largest indices kept in the health report, and the fields reported for each
+HEALTH_REPORT_TOP_INDICES = 50
+HEALTH_REPORT_INDEX_FIELDS = ('name', 'health', 'docs_count', 'store_size_bytes', 'store_size_human')
+
+# Longest wait, in seconds, between snapshot status checks
+SNAPSHOT_POLL_MAX_DELAY = 60
+
+# Longest snapshot delete path, kept under the default 4 KB http.max_initial_line_length
+SNAPSHOT_DELETE_MAX_PATH = 3072
 
 class ElasticsearchManager:
     def __init__(self, hosts: List[str], username: Optional[str] = None, 
@@ -27,6 +97,19 @@ class ElasticsearchManager:
         self.use_ssl = use_ssl
         self.verify_ssl = verify_ssl
         self.session = requests.Session()
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # One pooled adapter so concurrent requests reuse keep-alive connections instead of queueing
+        adapter = HTTPAdapter(
+            pool_connections=len(self.hosts),
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Ask for compressed JSON; needs http.compression: true on the cluster (default since 7.x)
+        self.session.headers.update({'Accept-Encoding': 'gzip, deflate', 'Accept': 'application/json'})
         
         # Setup authentication
         if username and password:
@@ -40,40 +123,65 @@ class ElasticsearchManager:
         
         self.setup_logging()
         self.base_url = self._get_active_host()
+        self._base = self.base_url.rstrip('/') + '/'  # endpoints are appended to this directly
     
     def setup_logging(self):
         """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
+        self.logger = logging.getLogger('es_manager')
+        
+        # Managers created later in the same process share the handlers added by the first
+        if not self.logger.handlers:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            handlers = [
                 logging.StreamHandler(sys.stdout),
-                logging.FileHandler(f'elasticsearch_manager_{datetime.datetime.now().strftime("%Y%m%d")}.log')
+                logging.handlers.RotatingFileHandler('elasticsearch_manager.log',
+                                                     maxBytes=10 * 1024 * 1024, backupCount=7)
             ]
-        )
-        self.logger = logging.getLogger(__name__)
+            for handler in handlers:
+                handler.setFormatter(formatter)
+                self.logger.addHandler(handler)
+            self.logger.setLevel(logging.INFO)
+            self.logger.propagate = False
     
     def _get_active_host(self) -> str:
         """Find an active Elasticsearch host"""
         protocol = 'https' if self.use_ssl else 'http'
+        candidates = [host if host.startswith(('http://', 'https://')) else f"{protocol}://{host}"
+                      for host in self.hosts]
         
-        for host in self.hosts:
-            if not host.startswith(('http://', 'https://')):
-                host = f"{protocol}://{host}"
-            
-            try:
-                response = self.session.get(f"{host}/", timeout=5)
-                if response.status_code == 200:
+        # Probe every host at once with a bodiless HEAD and take the first that answers
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        try:
+            futures = {executor.submit(self.session.head, f"{host}/", timeout=2): host for host in candidates}
+            for future in as_completed(futures):
+                host = futures[future]
+                try:
+                    status_code = future.result().status_code
+                except requests.exceptions.RequestException:
+                    continue
+                
+                if status_code in (200, 401):
+                    if status_code == 401:
+                        self.logger.warning(f"Elasticsearch at {host} rejected the supplied credentials")
                     self.logger.info(f"Connected to Elasticsearch at {host}")
                     return host
-            except requests.exceptions.RequestException:
-                continue
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         
         raise Exception(f"Could not connect to any Elasticsearch hosts: {self.hosts}")
     
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make HTTP request to Elasticsearch"""
-        url = urljoin(self.base_url, endpoint.lstrip('/'))
+        url = self._base + endpoint.lstrip('/')
+        
+        # Anything but a read may change cluster state, so cached reads are dropped
+        if method != 'GET':
+            self._cache.clear()
+        
+        # Encode JSON bodies ourselves so the faster serializer is used
+        if 'json' in kwargs:
+            kwargs['data'] = _json_dumps(kwargs.pop('json'))
+            kwargs['headers'] = {'Content-Type': 'application/json', **kwargs.get('headers', {})}
         
         try:
             response = self.session.request(method, url, timeout=30, **kwargs)
@@ -83,75 +191,159 @@ class ElasticsearchManager:
             self.logger.error(f"Request failed: {method} {url} - {e}")
             raise
     
+    def _cached_get(self, endpoint: str, params: Optional[Dict] = None, ttl: float = 5.0) -> Any:
+        """GET an endpoint's JSON, reusing a response younger than ttl seconds"""
+        key = f"{endpoint}?{sorted(params.items())}" if params else endpoint
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        
+        data = _json_loads(self._make_request('GET', endpoint, params=params).content)
+        self._cache[key] = (now, data)
+        return data
+    
+    def _parallel_get(self, endpoints: Dict[str, Optional[Dict]]) -> Dict[str, Any]:
+        """GET independent endpoints (mapped to their params) concurrently, returning JSON keyed by endpoint"""
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            return dict(zip(endpoints, executor.map(self._cached_get, endpoints, endpoints.values())))
+    
     def get_cluster_info(self) -> Dict:
         """Get cluster information"""
         try:
-            # Get basic cluster info
-            cluster_info = self._make_request('GET', '/').json()
-            
-            # Get cluster health
-            health = self._make_request('GET', '/_cluster/health').json()
-            
-            # Get cluster stats
-            stats = self._make_request('GET', '/_cluster/stats').json()
-            
-            # Get nodes info
-            nodes = self._make_request('GET', '/_nodes').json()
-            
-            return {
-                'cluster_info': cluster_info,
-                'health': health,
-                'stats': stats,
-                'nodes': nodes,
-                'summary': {
-                    'cluster_name': cluster_info.get('cluster_name', 'Unknown'),
-                    'version': cluster_info.get('version', {}).get('number', 'Unknown'),
-                    'status': health.get('status', 'Unknown'),
-                    'number_of_nodes': health.get('number_of_nodes', 0),
-                    'number_of_data_nodes': health.get('number_of_data_nodes', 0),
-                    'active_primary_shards': health.get('active_primary_shards', 0),
-                    'active_shards': health.get('active_shards', 0),
-                    'relocating_shards': health.get('relocating_shards', 0),
-                    'initializing_shards': health.get('initializing_shards', 0),
-                    'unassigned_shards': health.get('unassigned_shards', 0),
-                    'number_of_indices': stats.get('indices', {}).get('count', 0),
-                    'total_docs': stats.get('indices', {}).get('docs', {}).get('count', 0),
-                    'store_size': stats.get('indices', {}).get('store', {}).get('size_in_bytes', 0)
-                }
-            }
+            # Basic info, health, stats and nodes are independent, so fetch them together
+            # filter_path trims each response server-side to the fields the summary reads
+            return self._cluster_summary(self._parallel_get(CLUSTER_INFO_ENDPOINTS))
             
         except Exception as e:
             self.logger.error(f"Failed to get cluster info: {e}")
             return {}
     
-    def get_indices_info(self, index_pattern: str = "*") -> List[Dict]:
+    @staticmethod
+    def _cluster_summary(results: Dict[str, Any]) -> Dict:
+        """Combine the cluster info responses into the cluster info structure"""
+        cluster_info = results['/']
+        health = results['/_cluster/health']
+        stats = results['/_cluster/stats']
+        nodes = results['/_nodes']
+        
+        return {
+            'cluster_info': cluster_info,
+            'health': health,
+            'stats': stats,
+            'nodes': nodes,
+            'summary': {
+                'cluster_name': cluster_info.get('cluster_name', 'Unknown'),
+                'version': cluster_info.get('version', {}).get('number', 'Unknown'),
+                'status': health.get('status', 'Unknown'),
+                'number_of_nodes': health.get('number_of_nodes', 0),
+                'number_of_data_nodes': health.get('number_of_data_nodes', 0),
+                'active_primary_shards': health.get('active_primary_shards', 0),
+                'active_shards': health.get('active_shards', 0),
+                'relocating_shards': health.get('relocating_shards', 0),
+                'initializing_shards': health.get('initializing_shards', 0),
+                'unassigned_shards': health.get('unassigned_shards', 0),
+                'number_of_indices': stats.get('indices', {}).get('count', 0),
+                'total_docs': stats.get('indices', {}).get('docs', {}).get('count', 0),
+                'store_size': stats.get('indices', {}).get('store', {}).get('size_in_bytes', 0)
+            }
+        }
+    
+    def get_indices_info(self, index_pattern: str = "*", detailed: bool = False,
+                         top: Optional[int] = None, include_mappings: bool = False,
+                         include_settings: bool = False) -> List[Dict]:
         """Get information about indices"""
         try:
-            # Get indices stats
-            stats_response = self._make_request('GET', f'/{index_pattern}/_stats')
-            stats_data = stats_response.json()
+            if detailed or include_mappings or include_settings:
+                indices = self._get_indices_detailed(index_pattern, include_mappings, include_settings)
+            else:
+                indices = self._get_indices_cat(index_pattern)
             
-            # Get indices settings
-            settings_response = self._make_request('GET', f'/{index_pattern}/_settings')
-            settings_data = settings_response.json()
+            return self._largest_indices(indices, top)
             
-            # Get indices mappings
-            mappings_response = self._make_request('GET', f'/{index_pattern}/_mapping')
-            mappings_data = mappings_response.json()
+        except Exception as e:
+            self.logger.error(f"Failed to get indices info: {e}")
+            return []
+    
+    @staticmethod
+    def _largest_indices(indices: List[Dict], top: Optional[int] = None) -> List[Dict]:
+        """Sort by size, keeping only the largest when a limit is given"""
+        if top is not None:
+            return heapq.nlargest(top, indices, key=lambda x: x['store_size_bytes'])
+        indices.sort(key=lambda x: x['store_size_bytes'], reverse=True)
+        return indices
+    
+    def _get_indices_cat(self, index_pattern: str) -> List[Dict]:
+        """Summarize indices from the compact _cat/indices listing"""
+        response = self._make_request('GET', f'/_cat/indices/{index_pattern}', params=CAT_INDICES_PARAMS)
+        return self._indices_from_cat(_json_loads(response.content), index_pattern)
+    
+    def _indices_from_cat(self, rows: List[Dict], index_pattern: str) -> List[Dict]:
+        """Build index dicts from _cat/indices rows"""
+        indices = []
+        for row in rows:
+            index_name = row['index']
             
-            indices = []
+            # Skip system indices unless specifically requested
+            if index_name.startswith('.') and index_pattern == "*":
+                continue
             
-            for index_name, index_stats in stats_data.get('indices', {}).items():
+            # Closed indices report no docs or store size
+            store_size = int(row.get('store.size') or 0)
+            indices.append({
+                'name': index_name,
+                'health': row.get('health') or 'Unknown',
+                'status': row.get('status', 'open'),
+                'number_of_shards': int(row.get('pri') or 1),
+                'number_of_replicas': int(row.get('rep') or 1),
+                'docs_count': int(row.get('docs.count') or 0),
+                'docs_deleted': int(row.get('docs.deleted') or 0),
+                'store_size_bytes': store_size,
+                'store_size_human': self._format_bytes(store_size),
+                'creation_date': row.get('creation.date')
+            })
+        
+        return indices
+    
+    def _get_indices_detailed(self, index_pattern: str, include_mappings: bool = False,
+                              include_settings: bool = False) -> List[Dict]:
+        """Collect index stats and settings, plus mappings when requested"""
+        return list(self.iter_indices_info(index_pattern, include_mappings, include_settings))
+    
+    def iter_indices_info(self, index_pattern: str = "*", include_mappings: bool = False,
+                          include_settings: bool = False) -> Iterator[Dict]:
+        """Yield detailed index information while the _stats response is still being read"""
+        # Get indices settings
+        settings_response = self._make_request('GET', f'/{index_pattern}/_settings')
+        settings_data = _json_loads(settings_response.content)
+        
+        # Get indices mappings (often the largest response, so only when asked for)
+        mappings_data = {}
+        if include_mappings:
+            mappings_response = self._make_request('GET', f'/{index_pattern}/_mapping')
+            mappings_data = _json_loads(mappings_response.content)
+        
+        # One health call covering every index instead of one call per index
+        health_response = self._make_request('GET', '/_cluster/health', params={
+            'level': 'indices',
+            'filter_path': 'indices.*.status'
+        })
+        health_data = _json_loads(health_response.content).get('indices', {})
+        
+        # Get indices stats
+        with self._make_request('GET', f'/{index_pattern}/_stats', stream=True, params={
+            'filter_path': 'indices.*.total.docs.*,indices.*.total.store.size_in_bytes'
+        }) as stats_response:
+            for index_name, index_stats in self._iter_index_stats(stats_response):
                 # Skip system indices unless specifically requested
                 if index_name.startswith('.') and index_pattern == "*":
                     continue
                 
                 index_settings = settings_data.get(index_name, {}).get('settings', {})
-                index_mappings = mappings_data.get(index_name, {}).get('mappings', {})
                 
                 index_info = {
                     'name': index_name,
-                    'health': self._get_index_health(index_name),
+                    'health': health_data.get(index_name, {}).get('status', 'Unknown'),
                     'status': index_settings.get('index', {}).get('status', 'open'),
                     'number_of_shards': int(index_settings.get('index', {}).get('number_of_shards', 1)),
                     'number_of_replicas': int(index_settings.get('index', {}).get('number_of_replicas', 1)),
@@ -159,28 +351,26 @@ class ElasticsearchManager:
                     'docs_deleted': index_stats.get('total', {}).get('docs', {}).get('deleted', 0),
                     'store_size_bytes': index_stats.get('total', {}).get('store', {}).get('size_in_bytes', 0),
                     'store_size_human': self._format_bytes(index_stats.get('total', {}).get('store', {}).get('size_in_bytes', 0)),
-                    'creation_date': index_settings.get('index', {}).get('creation_date'),
-                    'mappings': index_mappings,
-                    'settings': index_settings
+                    'creation_date': index_settings.get('index', {}).get('creation_date')
                 }
                 
-                indices.append(index_info)
-            
-            # Sort by size
-            indices.sort(key=lambda x: x['store_size_bytes'], reverse=True)
-            return indices
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get indices info: {e}")
-            return []
+                if include_mappings:
+                    index_info['mappings'] = mappings_data.get(index_name, {}).get('mappings', {})
+                if include_settings:
+                    index_info['settings'] = index_settings
+                
+                yield index_info
     
-    def _get_index_health(self, index_name: str) -> str:
-        """Get health status for specific index"""
-        try:
-            response = self._make_request('GET', f'/_cluster/health/{index_name}')
-            return response.json().get('status', 'Unknown')
-        except:
-            return 'Unknown'
+    @staticmethod
+    def _iter_index_stats(response: requests.Response) -> Iterator[Tuple[str, Dict]]:
+        """Yield (index, stats) pairs from a streamed _stats response"""
+        if ijson is None:
+            yield from _json_loads(response.content).get('indices', {}).items()
+            return
+        
+        # Let urllib3 undo gzip so ijson reads plain JSON off the socket
+        response.raw.decode_content = True
+        yield from ijson.kvitems(response.raw, 'indices')
     
     def create_snapshot_repository(self, repo_name: str, repo_type: str = "fs", 
                                   location: str = None, **settings) -> bool:
@@ -253,17 +443,31 @@ class ElasticsearchManager:
                                     timeout: int = 3600) -> Dict:
         """Wait for snapshot to complete"""
         start_time = time.time()
+        iteration = 0
+        last_state = None
         
         while time.time() - start_time < timeout:
+            # Poll quickly at first and back off to at most a minute between checks
+            delay = min(SNAPSHOT_POLL_MAX_DELAY, 1.5 ** iteration)
+            iteration += 1
+            
             try:
-                response = self._make_request('GET', f'/_snapshot/{repo_name}/{snapshot_name}')
-                snapshot_data = response.json()
+                response = self._make_request('GET', f'/_snapshot/{repo_name}/{snapshot_name}', params={
+                    'filter_path': 'snapshots.snapshot,snapshots.state,snapshots.reason,snapshots.shards'
+                })
+                snapshot_data = _json_loads(response.content)
                 
                 snapshots = snapshot_data.get('snapshots', [])
                 if snapshots:
                     snapshot = snapshots[0]
                     state = snapshot.get('state')
                     
+                    # Restart the backoff whenever the snapshot changes state
+                    if state != last_state:
+                        last_state = state
+                        iteration = 1
+                        delay = 1.0
+                    
                     if state == 'SUCCESS':
                         self.logger.info(f"Snapshot completed successfully: {snapshot_name}")
                         return {
@@ -286,14 +490,16 @@ class ElasticsearchManager:
                                 progress = (successful / total) * 100
                                 self.logger.info(f"Snapshot progress: {progress:.1f}% ({successful}/{total} shards)")
                         
-                        time.sleep(30)  # Wait 30 seconds before checking again
+                        time.sleep(delay)
                     else:
                         self.logger.warning(f"Unknown snapshot state: {state}")
-                        time.sleep(30)
+                        time.sleep(delay)
+                else:
+                    time.sleep(delay)
                 
             except Exception as e:
                 self.logger.error(f"Error checking snapshot status: {e}")
-                time.sleep(30)
+                time.sleep(delay)
         
         self.logger.error(f"Snapshot creation timed out: {snapshot_name}")
         return {
@@ -301,35 +507,77 @@ class ElasticsearchManager:
             'error': 'Snapshot creation timed out'
         }
     
-    def list_snapshots(self, repo_name: str) -> List[Dict]:
+    def list_snapshots(self, repo_name: str, detail: bool = False) -> List[Dict]:
         """List snapshots in repository"""
         try:
-            response = self._make_request('GET', f'/_snapshot/{repo_name}/_all')
-            snapshot_data = response.json()
-            
-            snapshots = []
-            for snapshot in snapshot_data.get('snapshots', []):
-                snapshot_info = {
-                    'name': snapshot.get('snapshot'),
-                    'state': snapshot.get('state'),
-                    'start_time': snapshot.get('start_time'),
-                    'end_time': snapshot.get('end_time'),
-                    'duration_in_millis': snapshot.get('duration_in_millis'),
-                    'indices': snapshot.get('indices', []),
-                    'shards': snapshot.get('shards', {}),
-                    'size_in_bytes': snapshot.get('size_in_bytes', 0),
-                    'size_human': self._format_bytes(snapshot.get('size_in_bytes', 0))
-                }
-                snapshots.append(snapshot_info)
+            if not detail:
+                response = self._make_request('GET', f'/_cat/snapshots/{repo_name}', params=CAT_SNAPSHOTS_PARAMS)
+                return self._snapshots_from_cat(_json_loads(response.content))
             
-            # Sort by creation time
-            snapshots.sort(key=lambda x: x['start_time'], reverse=True)
-            return snapshots
+            response = self._make_request('GET', f'/_snapshot/{repo_name}/_all', params={
+                'filter_path': SNAPSHOT_LIST_FILTER
+            })
+            return self._snapshots_from_response(_json_loads(response.content))
             
         except Exception as e:
             self.logger.error(f"Failed to list snapshots: {e}")
             return []
     
+    def _snapshots_from_response(self, snapshot_data: Dict) -> List[Dict]:
+        """Build the snapshot listing, newest first"""
+        snapshots = []
+        for snapshot in snapshot_data.get('snapshots', []):
+            snapshot_info = {
+                'name': snapshot.get('snapshot'),
+                'state': snapshot.get('state'),
+                'start_time': snapshot.get('start_time'),
+                'start_time_in_millis': snapshot.get('start_time_in_millis'),
+                'end_time': snapshot.get('end_time'),
+                'duration_in_millis': snapshot.get('duration_in_millis'),
+                'indices': snapshot.get('indices', []),
+                'indices_count': len(snapshot.get('indices', [])),
+                'shards': snapshot.get('shards', {}),
+                'size_in_bytes': snapshot.get('size_in_bytes', 0),
+                'size_human': self._format_bytes(snapshot.get('size_in_bytes', 0))
+            }
+            snapshots.append(snapshot_info)
+        
+        # Sort by creation time
+        snapshots.sort(key=lambda x: x['start_time'], reverse=True)
+        return snapshots
+    
+    def _snapshots_from_cat(self, rows: List[Dict]) -> List[Dict]:
+        """Build the snapshot listing from _cat/snapshots rows, newest first"""
+        snapshots = []
+        for row in rows:
+            start_ms = int(row.get('start_epoch') or 0) * 1000 or None
+            end_ms = int(row.get('end_epoch') or 0) * 1000 or None
+            snapshots.append({
+                'name': row.get('id'),
+                'state': row.get('status'),
+                'start_time': self._epoch_ms_to_iso(start_ms),
+                'start_time_in_millis': start_ms,
+                'end_time': self._epoch_ms_to_iso(end_ms),
+                'duration_in_millis': int(row.get('duration') or 0),
+                'indices_count': int(row.get('indices') or 0),
+                'shards': {
+                    'total': int(row.get('total_shards') or 0),
+                    'successful': int(row.get('successful_shards') or 0),
+                    'failed': int(row.get('failed_shards') or 0)
+                }
+            })
+        
+        snapshots.sort(key=lambda x: x['start_time_in_millis'] or 0, reverse=True)
+        return snapshots
+    
+    @staticmethod
+    def _epoch_ms_to_iso(epoch_ms: Optional[int]) -> Optional[str]:
+        """Render epoch milliseconds in the snapshot API's UTC timestamp format"""
+        if epoch_ms is None:
+            return None
+        timestamp = datetime.datetime.fromtimestamp(epoch_ms / 1000, datetime.timezone.utc)
+        return timestamp.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+    
     def delete_snapshot(self, repo_name: str, snapshot_name: str) -> bool:
         """Delete snapshot"""
         try:
@@ -349,12 +597,15 @@ class ElasticsearchManager:
             return False
     
     def reindex_data(self, source_index: str, dest_index: str, 
-                    query: Optional[Dict] = None) -> Dict:
+                    query: Optional[Dict] = None, slices: str = 'auto',
+                    requests_per_second: Optional[float] = None,
+                    batch_size: Optional[int] = None) -> Dict:
         """Reindex data from source to destination"""
         try:
             self.logger.info(f"Reindexing from {source_index} to {dest_index}")
             
             reindex_body = {
+                "conflicts": "proceed",
                 "source": {
                     "index": source_index
                 },
@@ -365,12 +616,22 @@ class ElasticsearchManager:
             
             if query:
                 reindex_body["source"]["query"] = query
+            if batch_size:
+                reindex_body["source"]["size"] = batch_size
             
-            response = self._make_request('POST', '/_reindex', json=reindex_body,
-                                        params={"wait_for_completion": "false"})
+            # slices=auto runs one sub-task per source shard inside the cluster
+            params = {
+                "wait_for_completion": "false",
+                "slices": slices,
+                "refresh": "false"
+            }
+            if requests_per_second is not None:
+                params["requests_per_second"] = requests_per_second
+            
+            response = self._make_request('POST', '/_reindex', json=reindex_body, params=params)
             
             if response.status_code in [200, 201]:
-                task_data = response.json()
+                task_data = _json_loads(response.content)
                 task_id = task_data.get('task')
                 
                 if task_id:
@@ -401,24 +662,50 @@ class ElasticsearchManager:
         """Get task status"""
         try:
             response = self._make_request('GET', f'/_tasks/{task_id}')
-            return response.json()
+            return _json_loads(response.content)
         except Exception as e:
             self.logger.error(f"Failed to get task status: {e}")
             return {}
     
-    def optimize_indices(self, index_pattern: str = "*", max_num_segments: int = 1) -> Dict:
+    def optimize_indices(self, index_pattern: str = "*", max_num_segments: Optional[int] = None,
+                         only_expunge_deletes: bool = False, flush: bool = True,
+                         wait_for_completion: bool = False) -> Dict:
         """Optimize indices by forcing merge"""
+        if max_num_segments is not None and only_expunge_deletes:
+            error = "max_num_segments and only_expunge_deletes cannot be used together"
+            self.logger.error(f"Failed to optimize indices: {error}")
+            return {'status': 'failed', 'error': error}
+        
         try:
             self.logger.info(f"Optimizing indices: {index_pattern}")
             
-            response = self._make_request('POST', f'/{index_pattern}/_forcemerge',
-                                        params={"max_num_segments": max_num_segments})
+            # Only send options that were asked for; merging down to one segment rewrites the whole index
+            params = {
+                'flush': str(flush).lower(),
+                'wait_for_completion': str(wait_for_completion).lower()
+            }
+            if max_num_segments is not None:
+                params['max_num_segments'] = max_num_segments
+            if only_expunge_deletes:
+                params['only_expunge_deletes'] = 'true'
+            
+            response = self._make_request('POST', f'/{index_pattern}/_forcemerge', params=params)
             
             if response.status_code == 200:
+                result = _json_loads(response.content)
+                task_id = result.get('task')
+                
+                if task_id:
+                    self.logger.info(f"Force merge task started: {task_id}")
+                    return {
+                        'status': 'started',
+                        'task_id': task_id
+                    }
+                
                 self.logger.info("Index optimization completed")
                 return {
                     'status': 'success',
-                    'result': response.json()
+                    'result': result
                 }
             else:
                 return {
@@ -437,19 +724,21 @@ class ElasticsearchManager:
         """Clean up old snapshots"""
         try:
             snapshots = self.list_snapshots(repo_name)
-            cutoff_time = datetime.datetime.now() - datetime.timedelta(days=retention_days)
+            # Compare epoch milliseconds directly; no per-snapshot date parsing
+            cutoff_ms = int((time.time() - retention_days * 86400) * 1000)
             deleted_count = 0
+            expired = [
+                snapshot['name'] for snapshot in snapshots
+                if snapshot['start_time_in_millis'] and snapshot['start_time_in_millis'] < cutoff_ms
+            ]
             
-            for snapshot in snapshots:
-                if snapshot['start_time']:
-                    # Parse snapshot start time
-                    snapshot_time = datetime.datetime.strptime(
-                        snapshot['start_time'], '%Y-%m-%dT%H:%M:%S.%fZ'
-                    )
-                    
-                    if snapshot_time < cutoff_time:
-                        if self.delete_snapshot(repo_name, snapshot['name']):
-                            deleted_count += 1
+            # Elasticsearch 7.8+ deletes a comma-separated list of snapshots in one request
+            for batch in self._snapshot_delete_batches(repo_name, expired):
+                if self.delete_snapshot(repo_name, ','.join(batch)):
+                    deleted_count += len(batch)
+                elif len(batch) > 1:
+                    # Older clusters reject multi-snapshot deletes; retry this batch one by one
+                    deleted_count += sum(self.delete_snapshot(repo_name, name) for name in batch)
             
             self.logger.info(f"Cleaned up {deleted_count} old snapshots")
             return deleted_count
@@ -458,22 +747,42 @@ class ElasticsearchManager:
             self.logger.error(f"Failed to cleanup snapshots: {e}")
             return 0
     
-    def _format_bytes(self, bytes_size: int) -> str:
+    @staticmethod
+    def _snapshot_delete_batches(repo_name: str, names: List[str]) -> List[List[str]]:
+        """Group snapshot names so each DELETE path stays under SNAPSHOT_DELETE_MAX_PATH"""
+        batches = []
+        prefix_length = len(f'/_snapshot/{repo_name}/')
+        length = prefix_length
+        for name in names:
+            # Names count with their separating comma
+            if batches and length + len(name) + 1 <= SNAPSHOT_DELETE_MAX_PATH:
+                batches[-1].append(name)
+                length += len(name) + 1
+            else:
+                batches.append([name])
+                length = prefix_length + len(name)
+        return batches
+    
+    @staticmethod
+    def _format_bytes(bytes_size: int) -> str:
         """Format byte size to human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} PB"
+        index = 0 if bytes_size <= 0 else min(len(BYTE_UNITS) - 1, int(math.log2(bytes_size) // 10))
+        return f"{bytes_size / 1024.0 ** index:.1f} {BYTE_UNITS[index]}"
     
     def generate_health_report(self) -> Dict:
         """Generate comprehensive health report"""
         self.logger.info("Generating Elasticsearch health report")
-        
+        indices = self.get_indices_info(top=HEALTH_REPORT_TOP_INDICES, include_mappings=False,
+                                        include_settings=False)
+        return self._build_health_report(self.get_cluster_info(), indices)
+    
+    def _build_health_report(self, cluster_info: Dict, indices: List[Dict]) -> Dict:
+        """Run the health checks over fetched cluster and index information"""
         report = {
             'timestamp': datetime.datetime.now().isoformat(),
-            'cluster_info': self.get_cluster_info(),
-            'indices': self.get_indices_info(),
+            'cluster_info': cluster_info,
+            # Small per-index rows keep the report compact when serialized
+            'indices': [{field: index[field] for field in HEALTH_REPORT_INDEX_FIELDS} for index in indices],
             'health_checks': [],
             'recommendations': []
         }
@@ -520,6 +829,85 @@ class ElasticsearchManager:
         
         return report
 
+class AsyncElasticsearchManager(ElasticsearchManager):
+    """Manager whose read path fans out over a single aiohttp session"""
+    
+    def __init__(self, *args, max_concurrency: int = 16, **kwargs):
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for the async manager (pip install aiohttp)")
+        self.max_concurrency = max_concurrency
+        super().__init__(*args, **kwargs)
+    
+    def _client_session(self) -> 'aiohttp.ClientSession':
+        """Open a pooled aiohttp session; the semaphore bounds requests in flight"""
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector_options = {} if self.verify_ssl else {'ssl': False}
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=16, ttl_dns_cache=300,
+                                         keepalive_timeout=60, **connector_options)
+        auth = aiohttp.BasicAuth(self.username, self.password) if self.username and self.password else None
+        return aiohttp.ClientSession(connector=connector, auth=auth,
+                                     headers={'Accept': 'application/json'},
+                                     timeout=aiohttp.ClientTimeout(total=30))
+    
+    async def _get_json(self, http: 'aiohttp.ClientSession', endpoint: str,
+                        params: Optional[Dict] = None) -> Any:
+        """GET an endpoint and parse its JSON body"""
+        url = self._base + endpoint.lstrip('/')
+        async with self._semaphore:
+            async with http.get(url, params=params) as response:
+                response.raise_for_status()
+                return _json_loads(await response.read())
+    
+    async def get_cluster_info_async(self, http: 'aiohttp.ClientSession') -> Dict:
+        """Get cluster information"""
+        try:
+            responses = await asyncio.gather(*(
+                self._get_json(http, endpoint, params) for endpoint, params in CLUSTER_INFO_ENDPOINTS.items()
+            ))
+            return self._cluster_summary(dict(zip(CLUSTER_INFO_ENDPOINTS, responses)))
+        except Exception as e:
+            self.logger.error(f"Failed to get cluster info: {e}")
+            return {}
+    
+    async def get_indices_info_async(self, http: 'aiohttp.ClientSession', index_pattern: str = "*",
+                                     top: Optional[int] = None) -> List[Dict]:
+        """Get information about indices"""
+        try:
+            rows = await self._get_json(http, f'/_cat/indices/{index_pattern}', CAT_INDICES_PARAMS)
+            return self._largest_indices(self._indices_from_cat(rows, index_pattern), top)
+        except Exception as e:
+            self.logger.error(f"Failed to get indices info: {e}")
+            return []
+    
+    async def list_snapshots_async(self, http: 'aiohttp.ClientSession', repo_name: str,
+                                   detail: bool = False) -> List[Dict]:
+        """List snapshots in repository"""
+        try:
+            if not detail:
+                rows = await self._get_json(http, f'/_cat/snapshots/{repo_name}', CAT_SNAPSHOTS_PARAMS)
+                return self._snapshots_from_cat(rows)
+            
+            snapshot_data = await self._get_json(http, f'/_snapshot/{repo_name}/_all',
+                                                 {'filter_path': SNAPSHOT_LIST_FILTER})
+            return self._snapshots_from_response(snapshot_data)
+        except Exception as e:
+            self.logger.error(f"Failed to list snapshots: {e}")
+            return []
+    
+    async def generate_health_report_async(self) -> Dict:
+        """Generate the health report with every read issued concurrently"""
+        self.logger.info("Generating Elasticsearch health report")
+        async with self._client_session() as http:
+            cluster_info, indices = await asyncio.gather(
+                self.get_cluster_info_async(http),
+                self.get_indices_info_async(http, top=HEALTH_REPORT_TOP_INDICES)
+            )
+        return self._build_health_report(cluster_info, indices)
+    
+    def generate_health_report(self) -> Dict:
+        """Generate comprehensive health report"""
+        return asyncio.run(self.generate_health_report_async())
+
 def main():
     parser = argparse.ArgumentParser(description='Elasticsearch Management Tool')
     parser.add_argument('--hosts', nargs='+', default=['localhost:9200'], 
@@ -536,11 +924,19 @@ def main():
     parser.add_argument('--repo-location', help='Repository location for filesystem repos')
     parser.add_argument('--indices', default='*', help='Index pattern')
     parser.add_argument('--retention-days', type=int, default=7, help='Retention days for cleanup')
+    parser.add_argument('--use-async', action='store_true',
+                       help='Run the health report reads concurrently with aiohttp (requires aiohttp)')
+    # Elasticsearch rejects a force merge that sets both of these
+    merge_group = parser.add_mutually_exclusive_group()
+    merge_group.add_argument('--max-num-segments', type=int, help='Segments to merge down to when optimizing')
+    merge_group.add_argument('--only-expunge-deletes', action='store_true',
+                            help='Only merge away deleted documents when optimizing')
     
     args = parser.parse_args()
     
     # Initialize manager
-    manager = ElasticsearchManager(
+    manager_class = AsyncElasticsearchManager if args.use_async else ElasticsearchManager
+    manager = manager_class(
         hosts=args.hosts,
         username=args.username,
         password=args.password,
@@ -566,15 +962,17 @@ def main():
             print(f"Unassigned Shards: {summary.get('unassigned_shards', 0)}")
         
         elif args.action == 'indices':
-            indices = manager.get_indices_info(args.indices)
+            indices = manager.get_indices_info(args.indices, detailed=False, top=None,
+                                               include_mappings=False)
             
-            print(f"\nIndices Information ({len(indices)} indices):")
-            print("=" * 80)
+            # Build the listing in memory and write it once
+            lines = [f"\nIndices Information ({len(indices)} indices):", "=" * 80]
             for index in indices:
-                print(f"Name: {index['name']}")
-                print(f"  Status: {index['health']} | Docs: {index['docs_count']:,} | Size: {index['store_size_human']}")
-                print(f"  Shards: {index['number_of_shards']} | Replicas: {index['number_of_replicas']}")
-                print()
+                lines.append(f"Name: {index['name']}")
+                lines.append(f"  Status: {index['health']} | Docs: {index['docs_count']:,} | Size: {index['store_size_human']}")
+                lines.append(f"  Shards: {index['number_of_shards']} | Replicas: {index['number_of_replicas']}")
+                lines.append("")
+            sys.stdout.write('\n'.join(lines) + '\n')
         
         elif args.action == 'snapshot':
             if not args.snapshot_name:
@@ -590,24 +988,31 @@ def main():
                 print(f"Error: {result.get('error', 'Unknown error')}")
         
         elif args.action == 'list-snapshots':
-            snapshots = manager.list_snapshots(args.repo_name)
+            snapshots = manager.list_snapshots(args.repo_name, detail=False)
             
-            print(f"\nSnapshots in repository '{args.repo_name}' ({len(snapshots)} snapshots):")
-            print("=" * 80)
+            # Build the listing in memory and write it once
+            lines = [f"\nSnapshots in repository '{args.repo_name}' ({len(snapshots)} snapshots):", "=" * 80]
             for snapshot in snapshots:
-                print(f"Name: {snapshot['name']}")
-                print(f"  State: {snapshot['state']} | Size: {snapshot['size_human']}")
-                print(f"  Start: {snapshot['start_time']} | Duration: {snapshot.get('duration_in_millis', 0)/1000:.1f}s")
-                print(f"  Indices: {len(snapshot['indices'])} indices")
-                print()
+                lines.append(f"Name: {snapshot['name']}")
+                shards = snapshot.get('shards', {})
+                lines.append(f"  State: {snapshot['state']} | Shards: {shards.get('successful', 0)}/{shards.get('total', 0)}")
+                lines.append(f"  Start: {snapshot['start_time']} | Duration: {snapshot.get('duration_in_millis', 0)/1000:.1f}s")
+                lines.append(f"  Indices: {snapshot['indices_count']} indices")
+                lines.append("")
+            sys.stdout.write('\n'.join(lines) + '\n')
         
         elif args.action == 'cleanup':
             deleted = manager.cleanup_old_snapshots(args.repo_name, args.retention_days)
             print(f"Cleaned up {deleted} old snapshots")
         
         elif args.action == 'optimize':
-            result = manager.optimize_indices(args.indices)
+            result = manager.optimize_indices(args.indices, args.max_num_segments,
+                                              args.only_expunge_deletes)
             print(f"Optimization Status: {result['status']}")
+            if result.get('error'):
+                print(f"Error: {result['error']}")
+            if result.get('task_id'):
+                print(f"Task ID: {result['task_id']}")
         
         elif args.action == 'health':
             report = manager.generate_health_report()
@@ -14,17 +14,219 @@ import logging
 import json
 import gzip
 import shutil
-import glob
+import queue
+import threading
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 import pymongo
 from pymongo import MongoClient
-from bson import json_util
+from bson import decode_all, json_util
+from bson.json_util import CANONICAL_JSON_OPTIONS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json encoder
+
+# Wire protocol compressors offered to the server, in order of preference
+MONGO_WIRE_COMPRESSORS = 'zstd,snappy,zlib'
+
+# Read preference for backup reads when --read-from-secondary is on
+BACKUP_READ_PREFERENCE = 'secondaryPreferred'
+BACKUP_MAX_STALENESS_SECONDS = 120
+
+# Documents fetched per getMore; keeps round trips low while staying under the 16MB batch cap
+CURSOR_BATCH_SIZE = 1000
+
+# Write buffer for collection export files
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Wire batches fetched ahead while the previous ones are encoded and written
+PREFETCH_BATCHES = 4
+
+# Marks the end of a prefetched iterable
+_PREFETCH_DONE = object()
+
+# Multi-threaded compressors streamed behind tar: command and archive extension
+ARCHIVE_COMPRESSORS = {
+    'pigz': (['pigz', '-p', str(os.cpu_count() or 1), '-c'], '.tar.gz'),
+    # --long=27 widens the match window; verify/restore with zstd -d --long=27
+    'zstd': (['zstd', '-T0', '-3', '--long=27', '-q', '-c'], '.tar.zst'),
+}
+
+# mongodump output lines kept for the failure message
+MONGODUMP_TAIL_LINES = 20
+
+# Directory, beside the per-shard dumps, holding the config server replica set dump
+CONFIG_SERVER_DUMP_DIR = 'configsvr'
+
+ARCHIVE_EXTENSIONS = ('.tar.gz', '.tar.zst', '.tar')
+
+def _write_json(path, data, default):
+    """Write data as indented JSON, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, default=default, indent=2)
+
+def _count_bson_documents(batch):
+    """Count the documents in a raw BSON batch by walking their length prefixes"""
+    count = pos = 0
+    while pos < len(batch):
+        pos += int.from_bytes(batch[pos:pos + 4], 'little')
+        count += 1
+    return count
+
+def _write_extended_json(path, data):
+    """Write BSON-typed data as canonical Extended JSON so types survive a restore"""
+    with open(path, 'w') as f:
+        f.write(json_util.dumps(data, json_options=CANONICAL_JSON_OPTIONS, indent=2))
+
+def _prefetch(iterable, depth):
+    """Iterate in a background thread so fetching overlaps with the caller's work"""
+    pending = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    
+    def put(item):
+        # Give up once the consumer has gone away instead of blocking forever
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((_PREFETCH_DONE, None))
+        except Exception as e:
+            put((None, e))
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = pending.get()
+            if error is not None:
+                raise error
+            if item is _PREFETCH_DONE:
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+def _open_export(path, compress):
+    """Open an export file for binary writing, gzipped on the fly when requested"""
+    if compress:
+        # Level 1 is several times faster than the default at a small cost in ratio
+        return gzip.GzipFile(path, 'wb', compresslevel=1, mtime=0)
+    return open(path, 'wb', buffering=EXPORT_BUFFER_SIZE)
+
+def _export_documents(cursor, out_dir, collection_name, raw_bson, chunk_docs=None, chunk_bytes=None,
+                      compress=False):
+    """Write raw cursor batches to one file, or to numbered parts plus a manifest when chunking"""
+    extension = 'bson' if raw_bson else 'json'
+    if compress:
+        extension += '.gz'
+    chunked = bool(chunk_docs or chunk_bytes)
+    chunks = []
+    
+    def open_part():
+        if chunked:
+            part_file = f"{collection_name}.part{len(chunks):04d}.{extension}"
+        else:
+            part_file = f"{collection_name}.{extension}"
+        chunks.append({'file': part_file, 'documents': 0, 'bytes': 0})
+        return _open_export(os.path.join(out_dir, part_file), compress)
+    
+    f = open_part()
+    try:
+        for batch in cursor:
+            # Parts roll over on wire batch boundaries, so a part can overshoot by one batch
+            chunk = chunks[-1]
+            if chunked and chunk['documents'] and (
+                    (chunk_docs and chunk['documents'] >= chunk_docs) or
+                    (chunk_bytes and chunk['bytes'] >= chunk_bytes)):
+                f.close()
+                f = open_part()
+                chunk = chunks[-1]
+            
+            if raw_bson:
+                # Same layout as mongodump's .bson files
+                lines = [batch]
+                chunk['documents'] += _count_bson_documents(batch)
+            else:
+                # One writelines() per wire batch instead of a write() per document
+                lines = [json_util.dumps(document).encode() + b'\n' for document in decode_all(batch)]
+                chunk['documents'] += len(lines)
+            f.writelines(lines)
+            chunk['bytes'] += sum(map(len, lines))
+    finally:
+        f.close()
+    
+    if chunked:
+        manifest_file = os.path.join(out_dir, f"{collection_name}.manifest.json")
+        _write_json(manifest_file, {'collection': collection_name, 'format': extension, 'chunks': chunks}, str)
+    
+    return chunks
+
+def _dump_one_collection(conn_str, db_name, collection_name, out_dir, batch_size, raw_bson,
+                         chunk_docs=None, chunk_bytes=None, compress=False, indexes=None):
+    """Export one collection's documents, indexes and stats (runs in a worker process)"""
+    # Each worker opens its own client; connections must not cross a fork
+    client = MongoClient(conn_str, serverSelectionTimeoutMS=5000)
+    try:
+        db = client[db_name]
+        collection = db[collection_name]
+        
+        # Export collection data straight from the wire batches
+        cursor = collection.find_raw_batches(no_cursor_timeout=True, batch_size=batch_size)
+        batches = _prefetch(cursor, PREFETCH_BATCHES)
+        try:
+            _export_documents(batches, out_dir, collection_name, raw_bson, chunk_docs, chunk_bytes, compress)
+        finally:
+            batches.close()
+            cursor.close()
+        
+        # Export indexes, unless the caller already read them from the catalog
+        if indexes is None:
+            indexes = list(collection.list_indexes())
+        if indexes:
+            index_file = os.path.join(out_dir, f"{collection_name}_indexes.json")
+            _write_extended_json(index_file, indexes)
+        
+        # Get collection stats
+        try:
+            stats = db.command('collStats', collection_name)
+            stats_file = os.path.join(out_dir, f"{collection_name}_stats.json")
+            _write_extended_json(stats_file, stats)
+        except:
+            pass  # Stats not available for all collection types
+        
+        return collection_name
+    finally:
+        client.close()
 
 class MongoDBBackup:
     def __init__(self, config):
         self.config = config
         self.setup_logging()
         self.client = None
+        self._db_info = {}
+        self._server_info = None
+        self._dumped_shards = []
+        self._dumped_config_server = False
+        self._run_started_at = datetime.datetime.now()
+        self._mongodump_base_argv = self._build_mongodump_base_argv()
         
     def setup_logging(self):
         """Setup logging configuration"""
@@ -39,20 +241,31 @@ class MongoDBBackup:
         )
         self.logger = logging.getLogger(__name__)
     
+    def _connection_string(self):
+        """Build the MongoDB connection string from config"""
+        if self.config.get('username') and self.config.get('password'):
+            connection_string = f"mongodb://{self.config['username']}:{self.config['password']}@{self.config['host']}:{self.config['port']}/{self.config.get('auth_database', 'admin')}"
+        else:
+            connection_string = f"mongodb://{self.config['host']}:{self.config['port']}/"
+        
+        # Wire compression; drivers skip any compressor whose library isn't installed
+        options = [f"compressors={MONGO_WIRE_COMPRESSORS}"]
+        
+        # Add replica set if specified
+        if self.config.get('replica_set'):
+            options.append(f"replicaSet={self.config['replica_set']}")
+        
+        # Keep the backup's reads off the primary's working set
+        if self.config.get('read_from_secondary', True):
+            options.append(f"readPreference={BACKUP_READ_PREFERENCE}")
+            options.append(f"maxStalenessSeconds={BACKUP_MAX_STALENESS_SECONDS}")
+        
+        return connection_string + '?' + '&'.join(options)
+    
     def connect_to_mongodb(self):
         """Establish connection to MongoDB"""
         try:
-            # Build connection string
-            if self.config.get('username') and self.config.get('password'):
-                connection_string = f"mongodb://{self.config['username']}:{self.config['password']}@{self.config['host']}:{self.config['port']}/{self.config.get('auth_database', 'admin')}"
-            else:
-                connection_string = f"mongodb://{self.config['host']}:{self.config['port']}"
-            
-            # Add replica set if specified
-            if self.config.get('replica_set'):
-                connection_string += f"?replicaSet={self.config['replica_set']}"
-            
-            self.client = MongoClient(connection_string, serverSelectionTimeoutMS=5000)
+            self.client = MongoClient(self._connection_string(), serverSelectionTimeoutMS=5000)
             
             # Test connection
             self.client.admin.command('ping')
@@ -63,6 +276,12 @@ class MongoDBBackup:
             self.logger.error(f"Failed to connect to MongoDB: {str(e)}")
             return False
     
+    def get_server_info(self):
+        """Get server build info, fetched once per run"""
+        if self._server_info is None:
+            self._server_info = self.client.server_info()
+        return self._server_info
+    
     def get_database_info(self):
         """Get information about databases and collections"""
         try:
@@ -85,61 +304,183 @@ class MongoDBBackup:
                 }
             
             self.logger.info(f"Found {len(db_stats)} user databases")
+            self._db_info = db_stats
             return db_stats
             
         except Exception as e:
             self.logger.error(f"Failed to get database info: {str(e)}")
             return {}
     
+    def _scan_dump_output(self, backup_dir):
+        """List the databases and collections mongodump wrote under backup_dir"""
+        # Per-shard dumps add a <shard>/ level above mongodump's usual <db>/<collection>.bson[.gz]
+        dump_roots = [os.path.join(backup_dir, shard_id) for shard_id in self._dumped_shards] or [backup_dir]
+        
+        db_info = {}
+        for dump_root in dump_roots:
+            # A shard holding none of the --database selection gets no output directory
+            if not os.path.isdir(dump_root):
+                continue
+            with os.scandir(dump_root) as db_entries:
+                db_dirs = [entry for entry in db_entries if entry.is_dir(follow_symlinks=False)]
+            
+            for db_entry in db_dirs:
+                names = db_info.setdefault(db_entry.name, {'collection_names': []})['collection_names']
+                with os.scandir(db_entry.path) as entries:
+                    for entry in entries:
+                        name = entry.name[:-3] if entry.name.endswith('.gz') else entry.name
+                        if name.endswith('.bson') and name[:-len('.bson')] not in names:
+                            names.append(name[:-len('.bson')])
+        
+        for info in db_info.values():
+            info['collection_names'].sort()
+            info['collections'] = len(info['collection_names'])
+        
+        return db_info
+    
     def create_backup_directory(self):
         """Create backup directory structure"""
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = self._run_started_at.strftime("%Y%m%d_%H%M%S")
         backup_dir = os.path.join(self.config['backup_path'], f"mongodb_backup_{timestamp}")
         Path(backup_dir).mkdir(parents=True, exist_ok=True)
         return backup_dir
     
+    def _build_mongodump_base_argv(self):
+        """Build the mongodump arguments shared by every invocation in this run"""
+        cmd = [self.config.get('mongodump_path', 'mongodump')]
+        
+        # The password goes in a --config file per run, never on the command line
+        if self.config.get('username'):
+            cmd.extend(['--username', self.config['username']])
+            cmd.extend(['--authenticationDatabase', self.config.get('auth_database', 'admin')])
+        
+        if self.config.get('gzip', True):
+            cmd.append('--gzip')
+        
+        return cmd
+    
+    def _write_mongodump_config(self):
+        """Write the password to a private mongodump --config file so it stays out of ps"""
+        fd, path = tempfile.mkstemp(prefix='mongodump_', suffix='.yaml')  # created with mode 0600
+        with os.fdopen(fd, 'w') as f:
+            # A JSON string is also a valid YAML double-quoted scalar
+            f.write(f"password: {json.dumps(self.config['password'])}\n")
+        return path
+    
+    def _mongodump_command(self, base_argv, host, out_dir, oplog, database=None):
+        """Build a mongodump command line"""
+        cmd = base_argv + ['--host', host]
+        
+        if self.config.get('read_from_secondary', True):
+            cmd.extend(['--readPreference', BACKUP_READ_PREFERENCE])
+        
+        # Output directory
+        cmd.extend(['--out', out_dir])
+        
+        # Specific database if specified
+        if database:
+            cmd.extend(['--db', database])
+        
+        if oplog:
+            cmd.append('--oplog')
+        
+        return cmd
+    
+    def _run_mongodump(self, cmd, label='mongodump'):
+        """Run mongodump, logging its output as it arrives"""
+        self.logger.info(f"Starting {label} with command: {' '.join(cmd)}")
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        
+        # Log progress as it arrives; keep only the tail for the failure message
+        tail = deque(maxlen=MONGODUMP_TAIL_LINES)
+        for line in proc.stdout:
+            line = line.rstrip()
+            self.logger.info(f"[{label}] {line}")
+            tail.append(line)
+        returncode = proc.wait()
+        
+        if returncode == 0:
+            self.logger.info(f"{label} completed successfully")
+            return True
+        else:
+            tail_output = '\n'.join(tail)
+            self.logger.error(f"{label} failed: {tail_output}")
+            return False
+    
     def backup_using_mongodump(self, backup_dir):
         """Perform backup using mongodump"""
+        config_file = None
         try:
-            # Build mongodump command
-            cmd = [self.config.get('mongodump_path', 'mongodump')]
-            
-            # Connection parameters
-            cmd.extend(['--host', f"{self.config['host']}:{self.config['port']}"])
-            
-            if self.config.get('username'):
-                cmd.extend(['--username', self.config['username']])
-                cmd.extend(['--password', self.config['password']])
-                cmd.extend(['--authenticationDatabase', self.config.get('auth_database', 'admin')])
-            
-            # Output directory
-            cmd.extend(['--out', backup_dir])
-            
-            # Specific database if specified
-            if self.config.get('database'):
-                cmd.extend(['--db', self.config['database']])
-            
-            # Additional options
-            if self.config.get('gzip', True):
-                cmd.append('--gzip')
-            
-            if self.config.get('oplog', False):
-                cmd.append('--oplog')
+            base_argv = self._mongodump_base_argv
+            if self.config.get('username') and self.config.get('password'):
+                config_file = self._write_mongodump_config()
+                base_argv = base_argv + ['--config', config_file]
             
-            # Execute mongodump
-            self.logger.info(f"Starting mongodump with command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            shard_status = self.get_sharding_status()
+            if shard_status and shard_status.get('shards'):
+                return self._backup_shards_using_mongodump(base_argv, backup_dir, shard_status['shards'])
             
-            if result.returncode == 0:
-                self.logger.info("mongodump completed successfully")
-                return True
-            else:
-                self.logger.error(f"mongodump failed: {result.stderr}")
-                return False
+            cmd = self._mongodump_command(base_argv, f"{self.config['host']}:{self.config['port']}", backup_dir,
+                                          self.config.get('oplog', False), self.config.get('database'))
+            return self._run_mongodump(cmd)
                 
         except Exception as e:
             self.logger.error(f"Backup failed: {str(e)}")
             return False
+        finally:
+            if config_file:
+                os.remove(config_file)
+    
+    def _backup_shards_using_mongodump(self, base_argv, backup_dir, shards):
+        """Dump every shard and the config server in parallel, each from its replica set rather than mongos"""
+        # The config server holds the sharding metadata and chunk map needed to restore the shards as a cluster
+        try:
+            config_server_host = self.client.admin.command('getShardMap')['map']['config']
+        except Exception as e:
+            self.logger.error(f"Could not locate the config server replica set: {str(e)}")
+            return False
+        
+        # Stop chunk migrations so documents don't move between shards mid-dump,
+        # unless an operator has already disabled the balancer
+        balancer_stopped = False
+        try:
+            if self.client.admin.command('balancerStatus').get('mode') == 'off':
+                self.logger.info("Balancer already disabled, leaving it off")
+            else:
+                self.client.admin.command('balancerStop')
+                balancer_stopped = True
+                self.logger.info("Balancer stopped for the duration of the backup")
+        except Exception as e:
+            self.logger.warning(f"Could not stop the balancer: {str(e)}")
+        
+        try:
+            # --oplog gives each shard a point-in-time dump, but mongodump rejects it with --db
+            database = self.config.get('database')
+            oplog = not database
+            self._dumped_shards = [shard['_id'] for shard in shards]
+            with ThreadPoolExecutor(max_workers=len(shards) + 1) as executor:
+                futures = []
+                for shard in shards:
+                    # Shard hosts look like "rsName/host1:port,host2:port", which mongodump accepts as-is
+                    cmd = self._mongodump_command(base_argv, shard['host'], os.path.join(backup_dir, shard['_id']),
+                                                  oplog, database)
+                    futures.append(executor.submit(self._run_mongodump, cmd, f"mongodump {shard['_id']}"))
+                
+                # Always a full dump: the metadata covers every database, whatever --database selects
+                cmd = self._mongodump_command(base_argv, config_server_host,
+                                              os.path.join(backup_dir, CONFIG_SERVER_DUMP_DIR), True)
+                futures.append(executor.submit(self._run_mongodump, cmd, 'mongodump config server'))
+                results = [future.result() for future in futures]
+            
+            self._dumped_config_server = results[-1]
+            return all(results)
+        finally:
+            if balancer_stopped:
+                try:
+                    self.client.admin.command('balancerStart')
+                    self.logger.info("Balancer restarted")
+                except Exception as e:
+                    self.logger.error(f"Failed to restart the balancer: {str(e)}")
     
     def backup_with_custom_script(self, backup_dir):
         """Custom backup using pymongo (for specific collections or custom logic)"""
@@ -152,33 +493,44 @@ class MongoDBBackup:
             db_backup_dir = os.path.join(backup_dir, self.config['database'])
             Path(db_backup_dir).mkdir(exist_ok=True)
             
-            collections = db.list_collection_names()
+            # Reuse the listing from get_database_info when it covered this database
+            if self.config['database'] in self._db_info:
+                collections = self._db_info[self.config['database']]['collection_names']
+            else:
+                collections = db.list_collection_names()
+            raw_bson = self.config.get('raw_bson', False)
             
-            for collection_name in collections:
-                self.logger.info(f"Backing up collection: {collection_name}")
-                collection = db[collection_name]
-                
-                # Export collection data
-                collection_file = os.path.join(db_backup_dir, f"{collection_name}.json")
-                with open(collection_file, 'w') as f:
-                    for document in collection.find():
-                        f.write(json_util.dumps(document) + '\n')
-                
-                # Export indexes
-                indexes = list(collection.list_indexes())
-                if indexes:
-                    index_file = os.path.join(db_backup_dir, f"{collection_name}_indexes.json")
-                    with open(index_file, 'w') as f:
-                        json.dump(indexes, f, default=json_util.default, indent=2)
-                
-                # Get collection stats
-                try:
-                    stats = db.command('collStats', collection_name)
-                    stats_file = os.path.join(db_backup_dir, f"{collection_name}_stats.json")
-                    with open(stats_file, 'w') as f:
-                        json.dump(stats, f, default=json_util.default, indent=2)
-                except:
-                    pass  # Stats not available for all collection types
+            if not collections:
+                self.logger.info("Custom backup completed successfully")
+                return True
+            
+            catalog_indexes = self._get_catalog_indexes(self.config['database'])
+            
+            # One worker process per collection, like mongodump's -j
+            conn_str = self._connection_string()
+            max_workers = min(len(collections), self.config.get('parallel') or os.cpu_count() or 1)
+            failed = []
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_dump_one_collection, conn_str, self.config['database'], collection_name,
+                                    db_backup_dir, CURSOR_BATCH_SIZE, raw_bson,
+                                    self.config.get('chunk_docs'), self.config.get('chunk_bytes'),
+                                    self.config.get('gzip', True),
+                                    catalog_indexes.get(collection_name)): collection_name
+                    for collection_name in collections
+                }
+                for future in as_completed(futures):
+                    collection_name = futures[future]
+                    try:
+                        future.result()
+                        self.logger.info(f"Backed up collection: {collection_name}")
+                    except Exception as e:
+                        self.logger.error(f"Failed to back up collection {collection_name}: {str(e)}")
+                        failed.append(collection_name)
+            
+            if failed:
+                self.logger.error(f"Custom backup failed for {len(failed)} collections")
+                return False
             
             self.logger.info("Custom backup completed successfully")
             return True
@@ -187,16 +539,44 @@ class MongoDBBackup:
             self.logger.error(f"Custom backup failed: {str(e)}")
             return False
     
+    def _get_catalog_indexes(self, db_name):
+        """Read every collection's index specs for a database in one $listCatalog round trip"""
+        try:
+            # $listCatalog (MongoDB 6.0+) only runs cluster-wide against admin
+            catalog = self.client.admin.aggregate([
+                {'$listCatalog': {}},
+                {'$match': {'db': db_name}},
+                {'$project': {'name': 1, 'md.indexes.spec': 1}}
+            ])
+            return {
+                entry['name']: [index['spec'] for index in entry.get('md', {}).get('indexes', [])]
+                for entry in catalog
+            }
+        except Exception as e:
+            # Workers fall back to list_indexes() per collection
+            self.logger.info(f"$listCatalog unavailable, listing indexes per collection: {str(e)}")
+            return {}
+    
     def compress_backup(self, backup_dir):
         """Compress backup directory"""
         if not self.config.get('compress_archive', True):
             return backup_dir
             
         try:
-            compressed_file = f"{backup_dir}.tar.gz"
+            compressor = self.config.get('compressor', 'pigz')
             
             # Create compressed archive
-            shutil.make_archive(backup_dir, 'gztar', backup_dir)
+            if self._dump_is_compressed():
+                # Every collection is already gzipped; a second pass saves nothing
+                shutil.make_archive(backup_dir, 'tar', backup_dir)
+                compressed_file = f"{backup_dir}.tar"
+            elif compressor in ARCHIVE_COMPRESSORS and shutil.which(compressor):
+                compressed_file = self._stream_archive(backup_dir, compressor)
+            else:
+                if compressor != 'gzip':
+                    self.logger.warning(f"{compressor} not found on PATH, falling back to gzip")
+                shutil.make_archive(backup_dir, 'gztar', backup_dir)
+                compressed_file = f"{backup_dir}.tar.gz"
             
             # Remove original directory
             shutil.rmtree(backup_dir)
@@ -208,48 +588,107 @@ class MongoDBBackup:
             self.logger.error(f"Compression failed: {str(e)}")
             return backup_dir
     
+    def _dump_is_compressed(self):
+        """Whether the collection files were already gzipped while dumping"""
+        # Both mongodump --gzip and the custom backup compress as they write
+        return self.config.get('gzip', True)
+    
+    def _stream_archive(self, backup_dir, compressor):
+        """Pipe tar straight into an external compressor and return the archive path"""
+        command, extension = ARCHIVE_COMPRESSORS[compressor]
+        compressed_file = f"{backup_dir}{extension}"
+        
+        # Same layout as shutil.make_archive: paths relative to the backup directory
+        # tar's stderr goes to a temp file: a full stderr pipe would stall tar while the compressor waits on it
+        with open(compressed_file, 'wb') as out, tempfile.TemporaryFile() as tar_stderr:
+            processes = []
+            try:
+                tar = subprocess.Popen(['tar', '-C', backup_dir, '-cf', '-', '.'],
+                                       stdout=subprocess.PIPE, stderr=tar_stderr)
+                processes.append(tar)
+                comp = subprocess.Popen(command, stdin=tar.stdout, stdout=out, stderr=subprocess.PIPE)
+                processes.append(comp)
+                tar.stdout.close()  # compressor owns the pipe now
+                _, comp_err = comp.communicate()
+                tar.wait()
+            finally:
+                # Never leave a pipeline stage running if anything above raised
+                for process in processes:
+                    if process.poll() is None:
+                        process.kill()
+                        process.wait()
+            
+            tar_stderr.seek(0)
+            tar_err = tar_stderr.read()
+        
+        if tar.returncode != 0 or comp.returncode != 0:
+            os.remove(compressed_file)
+            raise RuntimeError((tar_err or comp_err).decode().strip())
+        
+        return compressed_file
+    
     def verify_backup(self, backup_path):
         """Verify backup integrity"""
         try:
             if backup_path.endswith('.tar.gz'):
-                # Verify compressed archive
+                # Verify compressed archive by checking the gzip stream CRC natively
+                if shutil.which('pigz'):
+                    cmd = ['pigz', '-t', '-p', str(os.cpu_count() or 1), backup_path]
+                else:
+                    cmd = ['gzip', '-t', backup_path]
+                result = subprocess.run(cmd, capture_output=True)
+                return result.returncode == 0
+            elif backup_path.endswith('.tar'):
                 import tarfile
-                with tarfile.open(backup_path, 'r:gz') as tar:
-                    tar.getnames()  # This will raise exception if corrupted
+                with tarfile.open(backup_path, 'r:') as tar:
+                    tar.getnames()
                 return True
+            elif backup_path.endswith('.tar.zst'):
+                result = subprocess.run(['zstd', '-t', '-q', '--long=27', backup_path], capture_output=True)
+                return result.returncode == 0
             else:
                 # Verify directory structure
                 if not os.path.exists(backup_path):
                     return False
                 
                 # Check if backup contains data
-                for root, dirs, files in os.walk(backup_path):
-                    if files:  # Found at least one file
-                        return True
-                
-                return False
+                return self._has_any_file(backup_path)
                 
         except Exception as e:
             self.logger.error(f"Backup verification failed: {str(e)}")
             return False
     
+    @staticmethod
+    def _has_any_file(path):
+        """Return True as soon as any regular file is found under path"""
+        stack = [path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        return True
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        return False
+    
     def cleanup_old_backups(self):
         """Remove old backups based on retention policy"""
         try:
-            pattern = os.path.join(self.config['backup_path'], "mongodb_backup_*")
-            backup_items = glob.glob(pattern)
+            cutoff_ts = (datetime.datetime.now() - datetime.timedelta(days=self.config['retention_days'])).timestamp()
             
-            cutoff_date = datetime.datetime.now() - datetime.timedelta(days=self.config['retention_days'])
-            
-            for backup_item in backup_items:
-                item_time = datetime.datetime.fromtimestamp(os.path.getmtime(backup_item))
-                if item_time < cutoff_date:
-                    if os.path.isdir(backup_item):
-                        shutil.rmtree(backup_item)
-                    else:
-                        os.remove(backup_item)
+            # One directory pass; DirEntry caches the type and stat per entry
+            with os.scandir(self.config['backup_path']) as entries:
+                for entry in entries:
+                    if not entry.name.startswith('mongodb_backup_'):
+                        continue
                     
-                    self.logger.info(f"Removed old backup: {os.path.basename(backup_item)}")
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_ts:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.remove(entry.path)
+                        
+                        self.logger.info(f"Removed old backup: {entry.name}")
                     
         except Exception as e:
             self.logger.error(f"Cleanup failed: {str(e)}")
@@ -286,14 +725,18 @@ class MongoDBBackup:
     def generate_backup_manifest(self, backup_path, db_info):
         """Generate backup manifest file"""
         manifest = {
-            'backup_timestamp': datetime.datetime.now().isoformat(),
-            'mongodb_version': self.client.server_info()['version'],
+            'backup_timestamp': self._run_started_at.isoformat(),
+            'mongodb_version': self.get_server_info()['version'],
             'backup_type': self.config.get('backup_type', 'mongodump'),
             'databases': db_info,
             'backup_path': backup_path,
             'config': {k: v for k, v in self.config.items() if k != 'password'}  # Exclude password
         }
         
+        # Plain tar archives hold collection files that were gzipped while dumping
+        if backup_path.endswith('.tar'):
+            manifest['archive_compression'] = 'none (collections already gzipped)'
+        
         # Add replica set info if available
         rs_status = self.get_replica_set_status()
         if rs_status:
@@ -304,20 +747,25 @@ class MongoDBBackup:
         if shard_status:
             manifest['sharding'] = True
             manifest['shard_count'] = len(shard_status['shards'])
+            if self._dumped_config_server:
+                manifest['config_server_dump'] = CONFIG_SERVER_DUMP_DIR
         
         # Write manifest file
-        if backup_path.endswith('.tar.gz'):
-            manifest_file = backup_path.replace('.tar.gz', '_manifest.json')
+        archive_ext = next((ext for ext in ARCHIVE_EXTENSIONS if backup_path.endswith(ext)), None)
+        if archive_ext:
+            manifest_file = backup_path[:-len(archive_ext)] + '_manifest.json'
         else:
             manifest_file = os.path.join(os.path.dirname(backup_path), 'backup_manifest.json')
         
-        with open(manifest_file, 'w') as f:
-            json.dump(manifest, f, indent=2, default=str)
+        _write_json(manifest_file, manifest, str)
         
         self.logger.info(f"Backup manifest created: {manifest_file}")
     
     def run(self):
         """Main execution method"""
+        # One timestamp names the backup directory and stamps the manifest
+        self._run_started_at = datetime.datetime.now()
+        
         # Create backup directory
         Path(self.config['backup_path']).mkdir(parents=True, exist_ok=True)
         
@@ -325,23 +773,28 @@ class MongoDBBackup:
         if not self.connect_to_mongodb():
             return False
         
-        # Get database information
-        db_info = self.get_database_info()
-        if not db_info:
-            self.logger.error("No databases found to backup")
-            return False
+        # mongodump enumerates databases itself; pre-scanning them only adds dbStats load
+        backup_method = self.config.get('backup_method', 'mongodump')
+        prescan = backup_method != 'mongodump' or self.config.get('verbose_manifest', False)
         
-        # Log database information
-        for db_name, info in db_info.items():
-            size_mb = info['stats'].get('dataSize', 0) / (1024 * 1024)
-            self.logger.info(f"Database: {db_name}, Collections: {info['collections']}, Size: {size_mb:.2f} MB")
+        db_info = {}
+        if prescan:
+            # Get database information
+            db_info = self.get_database_info()
+            if not db_info:
+                self.logger.error("No databases found to backup")
+                return False
+            
+            # Log database information
+            for db_name, info in db_info.items():
+                size_mb = info['stats'].get('dataSize', 0) / (1024 * 1024)
+                self.logger.info(f"Database: {db_name}, Collections: {info['collections']}, Size: {size_mb:.2f} MB")
         
         # Create backup directory
         backup_dir = self.create_backup_directory()
         self.logger.info(f"Backup directory: {backup_dir}")
         
         # Perform backup
-        backup_method = self.config.get('backup_method', 'mongodump')
         if backup_method == 'mongodump':
             success = self.backup_using_mongodump(backup_dir)
         else:
@@ -350,6 +803,10 @@ class MongoDBBackup:
         if not success:
             return False
         
+        # Describe what mongodump actually wrote before the directory is archived
+        if not prescan:
+            db_info = self._scan_dump_output(backup_dir)
+        
         # Compress backup if enabled
         final_backup_path = self.compress_backup(backup_dir)
         
@@ -387,8 +844,17 @@ def main():
     parser.add_argument('--backup-method', choices=['mongodump', 'custom'], default='mongodump', help='Backup method')
     parser.add_argument('--retention-days', type=int, default=7, help='Backup retention in days')
     parser.add_argument('--compress-archive', action='store_true', default=True, help='Compress backup archive')
-    parser.add_argument('--gzip', action='store_true', default=True, help='Use gzip compression in mongodump')
+    parser.add_argument('--compressor', choices=['gzip', 'pigz', 'zstd'], default='pigz', help='Archive compressor (falls back to gzip if not installed)')
+    parser.add_argument('--gzip', action=argparse.BooleanOptionalAction, default=True,
+                        help='Gzip collection files while dumping (--no-gzip leaves compression to --compressor)')
     parser.add_argument('--oplog', action='store_true', help='Include oplog in backup')
+    parser.add_argument('--parallel', type=int, help='Collections to back up in parallel in custom backups (default: CPU count)')
+    parser.add_argument('--chunk-docs', type=int, help='Split custom backup files every N documents')
+    parser.add_argument('--chunk-bytes', type=int, help='Split custom backup files every N bytes')
+    parser.add_argument('--read-from-secondary', action=argparse.BooleanOptionalAction, default=True,
+                        help='Read from secondaries when available')
+    parser.add_argument('--raw-bson', action='store_true', help='Write raw BSON instead of JSON in custom backups')
+    parser.add_argument('--verbose-manifest', action='store_true', help='Collect dbStats for the manifest before running mongodump')
     parser.add_argument('--include-system-dbs', action='store_true', help='Include system databases')
     
     args = parser.parse_args()
@@ -406,9 +872,16 @@ def main():
         'backup_method': args.backup_method,
         'retention_days': args.retention_days,
         'compress_archive': args.compress_archive,
+        'compressor': args.compressor,
         'gzip': args.gzip,
         'oplog': args.oplog,
-        'include_system_dbs': args.include_system_dbs
+        'raw_bson': args.raw_bson,
+        'read_from_secondary': args.read_from_secondary,
+        'parallel': args.parallel,
+        'chunk_docs': args.chunk_docs,
+        'chunk_bytes': args.chunk_bytes,
+        'include_system_dbs': args.include_system_dbs,
+        'verbose_manifest': args.verbose_manifest
     }
     
     backup = MongoDBBackup(config)
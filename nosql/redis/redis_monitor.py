@@ -6,15 +6,99 @@ Purpose: Comprehensive Redis cluster and standalone monitoring
 """
 
 import redis
+from redis.utils import HIREDIS_AVAILABLE
+import re
 import sys
 import json
 import time
 import argparse
 import logging
-from typing import Dict, List, Optional, Union
+from itertools import islice
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 
+# Connections per shared pool; waits for a free connection instead of opening more
+POOL_MAX_CONNECTIONS = 8
+
+# Keys per pipelined TYPE / MEMORY USAGE round trip during key analysis
+KEY_ANALYSIS_BATCH_SIZE = 500
+
+# Key prefix ends at the first ':' or '_'; one C-level scan per key
+KEY_PREFIX_SEPARATOR = re.compile(rb'[:_]')
+
+# Upper bound for the SCAN COUNT hint while sampling keys
+SCAN_COUNT_MAX = 1024
+
+# SCAN calls per sampling script run; a selective MATCH can walk much of the keyspace,
+# and a script blocks the server until it returns, so longer walks resume from Python
+KEY_PATTERN_SCRIPT_MAX_SCANS = 8
+
+# Server-side key sampling: SCAN, TYPE and MEMORY USAGE aggregated per key prefix.
+# ARGV[1] = keys to sample, ARGV[2] = SCAN COUNT hint, ARGV[3] = MATCH pattern or '',
+# ARGV[4] = cursor to resume from, ARGV[5] = SCAN calls allowed in this run.
+# Returns the aggregates and the cursor to resume from ('0' once the keyspace is done).
+# Prefixes match analyze_key_patterns.
+KEY_PATTERN_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local patterns = {}
+local count, total_size = 0, 0
+local cursor = ARGV[4]
+local scans = tonumber(ARGV[5])
+repeat
+    local reply
+    if ARGV[3] ~= '' then
+        reply = redis.call('SCAN', cursor, 'MATCH', ARGV[3], 'COUNT', ARGV[2])
+    else
+        reply = redis.call('SCAN', cursor, 'COUNT', ARGV[2])
+    end
+    cursor = reply[1]
+    for _, key in ipairs(reply[2]) do
+        if count >= limit then break end
+        local key_type = redis.call('TYPE', key)['ok']
+        local key_size = redis.pcall('MEMORY', 'USAGE', key)
+        if type(key_size) ~= 'number' then key_size = 0 end
+        local pattern = 'simple'
+        if string.find(key, '[:_]') then pattern = string.match(key, '^[^:_]*') end
+        local info = patterns[pattern]
+        if not info then
+            info = {count = 0, total_size = 0, max_size = 0, types = {}, sample_keys = {}}
+            patterns[pattern] = info
+        end
+        info.count = info.count + 1
+        info.total_size = info.total_size + key_size
+        info.types[key_type] = (info.types[key_type] or 0) + 1
+        if key_size > info.max_size then info.max_size = key_size end
+        if #info.sample_keys < 5 then table.insert(info.sample_keys, key) end
+        count = count + 1
+        total_size = total_size + key_size
+    end
+    scans = scans - 1
+until cursor == '0' or count >= limit or scans == 0
+return cjson.encode({patterns = patterns, count = count, total_size = total_size, cursor = cursor})
+"""
+
+def _configure_logging(log_to_stdout: bool = True):
+    """Attach the command-line log handlers to the redis_monitor logger once per process"""
+    logger = logging.getLogger('redis_monitor')
+    if logger.handlers:
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    # delay=True: the log file is only created once something is actually logged
+    handlers = [logging.FileHandler(f'redis_monitor_{datetime.now().strftime("%Y%m%d")}.log', delay=True)]
+    if log_to_stdout:
+        handlers.append(logging.StreamHandler(sys.stdout))
+    
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
 class RedisMonitor:
+    # Clients (and their connection pools) shared by every monitor in the process
+    _clients: Dict[tuple, redis.Redis] = {}
+    
     def __init__(self, host: str = 'localhost', port: int = 6379, 
                  password: Optional[str] = None, db: int = 0, 
                  cluster_mode: bool = False):
@@ -23,47 +107,84 @@ class RedisMonitor:
         self.password = password
         self.db = db
         self.cluster_mode = cluster_mode
+        self._pattern_script = None
         self.setup_logging()
         self.connect_to_redis()
     
     def setup_logging(self):
         """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler(f'redis_monitor_{datetime.now().strftime("%Y%m%d")}.log')
-            ]
+        # Handlers are installed once by the CLI (_configure_logging); library callers bring their own
+        self.logger = logging.getLogger('redis_monitor')
+    
+    def _create_client(self, protocol: int):
+        """Reuse or create the Redis client and verify it with a PING"""
+        # Building a client populates large callback tables (and discovers the topology
+        # in cluster mode), so each process builds one per server and reuses it
+        client_key = (self.host, self.port, self.db, self.password, self.cluster_mode, protocol)
+        client = RedisMonitor._clients.get(client_key)
+        if client is None:
+            client = self._build_client(protocol)
+        
+        # Test connection
+        try:
+            client.ping()
+        except Exception:
+            # Don't keep a client around for settings that can't connect
+            RedisMonitor._clients.pop(client_key, None)
+            if self.cluster_mode:
+                client.close()
+            else:
+                client.connection_pool.disconnect()
+            raise
+        
+        RedisMonitor._clients[client_key] = client
+        self.redis_client = client
+    
+    def _build_client(self, protocol: int):
+        """Construct a cluster client, or a standalone client over a blocking pool"""
+        if self.cluster_mode:
+            from redis.cluster import RedisCluster
+            return RedisCluster(
+                host=self.host,
+                port=self.port,
+                decode_responses=False,
+                password=self.password,
+                skip_full_coverage_check=True,
+                protocol=protocol
+            )
+        
+        pool = redis.BlockingConnectionPool(
+            host=self.host,
+            port=self.port,
+            password=self.password,
+            db=self.db,
+            decode_responses=False,
+            socket_connect_timeout=5,
+            socket_keepalive=True,
+            protocol=protocol,
+            max_connections=POOL_MAX_CONNECTIONS
         )
-        self.logger = logging.getLogger(__name__)
+        return redis.Redis(connection_pool=pool)
     
     def connect_to_redis(self):
         """Connect to Redis server or cluster"""
         try:
-            if self.cluster_mode:
-                from redis.cluster import RedisCluster
-                startup_nodes = [{"host": self.host, "port": self.port}]
-                self.redis_client = RedisCluster(
-                    startup_nodes=startup_nodes,
-                    decode_responses=True,
-                    password=self.password,
-                    skip_full_coverage_check=True
-                )
-                self.logger.info(f"Connected to Redis cluster at {self.host}:{self.port}")
-            else:
-                self.redis_client = redis.Redis(
-                    host=self.host,
-                    port=self.port,
-                    password=self.password,
-                    db=self.db,
-                    decode_responses=True,
-                    socket_connect_timeout=5
-                )
-                self.logger.info(f"Connected to Redis server at {self.host}:{self.port}")
+            # RESP3 replies are typed on the wire; servers before Redis 6 reject the HELLO handshake
+            try:
+                self._create_client(protocol=3)
+            except redis.ResponseError as e:
+                self.logger.info(f"RESP3 not supported by server, falling back to RESP2: {e}")
+                self._create_client(protocol=2)
+            
+            mode = 'cluster' if self.cluster_mode else 'server'
+            self.logger.info(f"Connected to Redis {mode} at {self.host}:{self.port}")
+            
+            if not HIREDIS_AVAILABLE:
+                self.logger.info("hiredis not installed; replies are parsed in pure Python")
             
-            # Test connection
-            self.redis_client.ping()
+            # Cluster nodes reject scripts that touch keys outside the declared slots
+            if not self.cluster_mode:
+                self._pattern_script = self.redis_client.register_script(KEY_PATTERN_SCRIPT)
             
         except redis.ConnectionError as e:
             self.logger.error(f"Failed to connect to Redis: {e}")
@@ -72,10 +193,24 @@ class RedisMonitor:
             self.logger.error(f"Unexpected error connecting to Redis: {e}")
             sys.exit(1)
     
-    def get_server_info(self) -> Dict:
+    @staticmethod
+    def _decode(value: Union[bytes, str]) -> str:
+        """Decode a raw reply value for display"""
+        return value.decode('utf-8', 'replace') if isinstance(value, bytes) else value
+    
+    def _get_all_info(self) -> Optional[Dict]:
+        """Fetch every INFO section in one call; None lets each getter query its own section"""
+        try:
+            return self.redis_client.info('all')
+        except Exception as e:
+            self.logger.error(f"Failed to get INFO: {e}")
+            return None
+    
+    def get_server_info(self, info: Optional[Dict] = None) -> Dict:
         """Get comprehensive server information"""
         try:
-            info = self.redis_client.info()
+            if info is None:
+                info = self.redis_client.info()
             
             server_info = {
                 'redis_version': info.get('redis_version', 'Unknown'),
@@ -94,10 +229,11 @@ class RedisMonitor:
             self.logger.error(f"Failed to get server info: {e}")
             return {}
     
-    def get_memory_info(self) -> Dict:
+    def get_memory_info(self, info: Optional[Dict] = None) -> Dict:
         """Get memory usage information"""
         try:
-            info = self.redis_client.info('memory')
+            if info is None:
+                info = self.redis_client.info('memory')
             
             memory_info = {
                 'used_memory': info.get('used_memory', 0),
@@ -127,10 +263,11 @@ class RedisMonitor:
             self.logger.error(f"Failed to get memory info: {e}")
             return {}
     
-    def get_client_info(self) -> Dict:
+    def get_client_info(self, info: Optional[Dict] = None) -> Dict:
         """Get client connection information"""
         try:
-            info = self.redis_client.info('clients')
+            if info is None:
+                info = self.redis_client.info('clients')
             
             client_info = {
                 'connected_clients': info.get('connected_clients', 0),
@@ -146,10 +283,11 @@ class RedisMonitor:
             self.logger.error(f"Failed to get client info: {e}")
             return {}
     
-    def get_stats_info(self) -> Dict:
+    def get_stats_info(self, info: Optional[Dict] = None) -> Dict:
         """Get statistics information"""
         try:
-            info = self.redis_client.info('stats')
+            if info is None:
+                info = self.redis_client.info('stats')
             
             stats_info = {
                 'total_connections_received': info.get('total_connections_received', 0),
@@ -181,15 +319,21 @@ class RedisMonitor:
             self.logger.error(f"Failed to get stats info: {e}")
             return {}
     
-    def get_keyspace_info(self) -> Dict:
+    def get_keyspace_info(self, info: Optional[Dict] = None) -> Dict:
         """Get keyspace information"""
         try:
-            info = self.redis_client.info('keyspace')
+            if info is None:
+                info = self.redis_client.info('keyspace')
             
             keyspace_info = {}
             for key, value in info.items():
                 if key.startswith('db'):
                     db_num = key
+                    # redis-py already splits "keys=X,expires=Y,avg_ttl=Z" into a dict
+                    if isinstance(value, dict):
+                        keyspace_info[db_num] = value
+                        continue
+                    
                     # Parse the database info string
                     # Format: "keys=X,expires=Y,avg_ttl=Z"
                     db_info = {}
@@ -204,10 +348,11 @@ class RedisMonitor:
             self.logger.error(f"Failed to get keyspace info: {e}")
             return {}
     
-    def get_replication_info(self) -> Dict:
+    def get_replication_info(self, info: Optional[Dict] = None) -> Dict:
         """Get replication information"""
         try:
-            info = self.redis_client.info('replication')
+            if info is None:
+                info = self.redis_client.info('replication')
             
             replication_info = {
                 'role': info.get('role', 'unknown'),
@@ -239,10 +384,11 @@ class RedisMonitor:
             self.logger.error(f"Failed to get replication info: {e}")
             return {}
     
-    def get_persistence_info(self) -> Dict:
+    def get_persistence_info(self, info: Optional[Dict] = None) -> Dict:
         """Get persistence information"""
         try:
-            info = self.redis_client.info('persistence')
+            if info is None:
+                info = self.redis_client.info('persistence')
             
             persistence_info = {
                 'loading': info.get('loading', 0),
@@ -287,9 +433,9 @@ class RedisMonitor:
                     'timestamp': datetime.fromtimestamp(entry['start_time']).strftime('%Y-%m-%d %H:%M:%S'),
                     'duration_microseconds': entry['duration'],
                     'duration_milliseconds': round(entry['duration'] / 1000, 2),
-                    'command': ' '.join(str(arg) for arg in entry['command']),
-                    'client_address': entry.get('client_address', 'Unknown'),
-                    'client_name': entry.get('client_name', 'Unknown')
+                    'command': self._decode(entry['command']),
+                    'client_address': self._decode(entry.get('client_address', 'Unknown')),
+                    'client_name': self._decode(entry.get('client_name', 'Unknown'))
                 }
                 slow_queries.append(query_info)
             
@@ -339,51 +485,20 @@ class RedisMonitor:
             self.logger.error(f"Failed to get cluster info: {e}")
             return None
     
-    def analyze_key_patterns(self, sample_size: int = 1000) -> Dict:
+    def analyze_key_patterns(self, sample_size: int = 1000, match: Optional[str] = None) -> Dict:
         """Analyze key patterns and sizes"""
         try:
             self.logger.info(f"Analyzing key patterns (sampling {sample_size} keys)...")
             
-            patterns = {}
-            total_size = 0
-            key_count = 0
-            
-            # Get a sample of keys
-            for key in self.redis_client.scan_iter(count=sample_size):
-                if key_count >= sample_size:
-                    break
-                
-                try:
-                    key_type = self.redis_client.type(key)
-                    key_size = self.redis_client.memory_usage(key) or 0
-                    
-                    # Extract pattern (first part before : or _ if exists)
-                    pattern = key.split(':')[0].split('_')[0] if ':' in key or '_' in key else 'simple'
-                    
-                    if pattern not in patterns:
-                        patterns[pattern] = {
-                            'count': 0,
-                            'total_size': 0,
-                            'types': {},
-                            'avg_size': 0,
-                            'max_size': 0,
-                            'sample_keys': []
-                        }
-                    
-                    patterns[pattern]['count'] += 1
-                    patterns[pattern]['total_size'] += key_size
-                    patterns[pattern]['types'][key_type] = patterns[pattern]['types'].get(key_type, 0) + 1
-                    patterns[pattern]['max_size'] = max(patterns[pattern]['max_size'], key_size)
-                    
-                    if len(patterns[pattern]['sample_keys']) < 5:
-                        patterns[pattern]['sample_keys'].append(key)
-                    
-                    total_size += key_size
-                    key_count += 1
-                    
-                except Exception as e:
-                    self.logger.debug(f"Error analyzing key {key}: {e}")
-                    continue
+            # COUNT is only a per-call hint; no point asking for more than we will keep
+            scan_count = max(1, min(sample_size, SCAN_COUNT_MAX))
+            
+            # Aggregate on the server when possible so no key names cross the wire
+            sampled = self._sample_key_patterns_server_side(sample_size, scan_count, match)
+            if sampled is not None:
+                patterns, key_count, total_size = sampled
+            else:
+                patterns, key_count, total_size = self._sample_key_patterns_client_side(sample_size, scan_count, match)
             
             # Calculate averages
             for pattern in patterns:
@@ -403,6 +518,125 @@ class RedisMonitor:
             self.logger.error(f"Failed to analyze key patterns: {e}")
             return {}
     
+    def _sample_key_patterns_server_side(self, sample_size: int, scan_count: int,
+                                         match: Optional[str] = None) -> Optional[Tuple[Dict, int, int]]:
+        """Run the key sampling script on the server; None if scripting is unavailable"""
+        if self._pattern_script is None:
+            return None
+        
+        patterns = {}
+        key_count = 0
+        total_size = 0
+        cursor = '0'
+        
+        # Each run does a bounded number of SCAN calls so the server never blocks for long
+        while True:
+            try:
+                result = json.loads(self._decode(self._pattern_script(args=[
+                    sample_size - key_count, scan_count, match or '', cursor, KEY_PATTERN_SCRIPT_MAX_SCANS
+                ])))
+            except redis.ResponseError as e:
+                self.logger.info(f"Server-side key sampling unavailable, sampling from the client: {e}")
+                return None
+            
+            # cjson encodes empty Lua tables as objects
+            self._merge_key_patterns(patterns, result['patterns'] or {})
+            key_count += result['count']
+            total_size += result['total_size']
+            cursor = result['cursor']
+            
+            if cursor == '0' or key_count >= sample_size:
+                return patterns, key_count, total_size
+    
+    @staticmethod
+    def _merge_key_patterns(patterns: Dict, partial: Dict):
+        """Fold one sampling script run's per-prefix aggregates into patterns"""
+        for pattern, info in partial.items():
+            if pattern not in patterns:
+                info['avg_size'] = 0
+                patterns[pattern] = info
+                continue
+            
+            merged = patterns[pattern]
+            merged['count'] += info['count']
+            merged['total_size'] += info['total_size']
+            merged['max_size'] = max(merged['max_size'], info['max_size'])
+            for key_type, count in info['types'].items():
+                merged['types'][key_type] = merged['types'].get(key_type, 0) + count
+            merged['sample_keys'].extend(info['sample_keys'][:5 - len(merged['sample_keys'])])
+    
+    def _sample_key_patterns_client_side(self, sample_size: int, scan_count: int,
+                                         match: Optional[str] = None) -> Tuple[Dict, int, int]:
+        """SCAN keys and fetch TYPE / MEMORY USAGE in pipelined batches"""
+        patterns = {}
+        total_size = 0
+        key_count = 0
+        
+        batch = []
+        # islice stops pulling SCAN pages as soon as the sample is full
+        for key in islice(self.redis_client.scan_iter(match=match, count=scan_count), sample_size):
+            batch.append(key)
+            if len(batch) == KEY_ANALYSIS_BATCH_SIZE:
+                batch_count, batch_size = self._analyze_key_batch(batch, patterns)
+                key_count += batch_count
+                total_size += batch_size
+                batch = []
+        
+        if batch:
+            batch_count, batch_size = self._analyze_key_batch(batch, patterns)
+            key_count += batch_count
+            total_size += batch_size
+        
+        return patterns, key_count, total_size
+    
+    def _analyze_key_batch(self, keys: List[bytes], patterns: Dict) -> Tuple[int, int]:
+        """Fetch TYPE and MEMORY USAGE for a batch of keys in one round trip and tally patterns"""
+        # Cluster clients split a non-transactional pipeline per node on their own
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.type(key)
+            pipe.memory_usage(key)
+        results = pipe.execute(raise_on_error=False)
+        
+        key_count = 0
+        total_size = 0
+        for key, key_type, key_size in zip(keys, results[0::2], results[1::2]):
+            if isinstance(key_type, Exception):
+                self.logger.debug(f"Error analyzing key {key}: {key_type}")
+                continue
+            
+            # MEMORY USAGE returns None for vanished keys and errors where the command is disabled
+            if isinstance(key_size, Exception) or key_size is None:
+                key_size = 0
+            
+            # Extract pattern (first part before : or _ if exists); keys stay bytes until here
+            separator = KEY_PREFIX_SEPARATOR.search(key)
+            pattern = key[:separator.start()].decode('utf-8', 'replace') if separator else 'simple'
+            key_type = key_type.decode('ascii')
+            
+            if pattern not in patterns:
+                patterns[pattern] = {
+                    'count': 0,
+                    'total_size': 0,
+                    'types': {},
+                    'avg_size': 0,
+                    'max_size': 0,
+                    'sample_keys': []
+                }
+            
+            patterns[pattern]['count'] += 1
+            patterns[pattern]['total_size'] += key_size
+            patterns[pattern]['types'][key_type] = patterns[pattern]['types'].get(key_type, 0) + 1
+            patterns[pattern]['max_size'] = max(patterns[pattern]['max_size'], key_size)
+            
+            if len(patterns[pattern]['sample_keys']) < 5:
+                patterns[pattern]['sample_keys'].append(key.decode('utf-8', 'replace'))
+            
+            total_size += key_size
+            key_count += 1
+        
+        return key_count, total_size
+    
     def get_config(self) -> Dict:
         """Get Redis configuration"""
         try:
@@ -430,31 +664,42 @@ class RedisMonitor:
         """Generate comprehensive Redis monitoring report"""
         self.logger.info("Generating comprehensive Redis monitoring report...")
         
+        # One INFO round trip feeds every section of the report
+        info = self._get_all_info()
+        memory_info = self.get_memory_info(info)
+        stats_info = self.get_stats_info(info)
+        
         report = {
             'timestamp': datetime.now().isoformat(),
-            'server_info': self.get_server_info(),
-            'memory_info': self.get_memory_info(),
-            'client_info': self.get_client_info(),
-            'stats_info': self.get_stats_info(),
-            'keyspace_info': self.get_keyspace_info(),
-            'replication_info': self.get_replication_info(),
-            'persistence_info': self.get_persistence_info(),
+            'server_info': self.get_server_info(info),
+            'memory_info': memory_info,
+            'client_info': self.get_client_info(info),
+            'stats_info': stats_info,
+            'keyspace_info': self.get_keyspace_info(info),
+            'replication_info': self.get_replication_info(info),
+            'persistence_info': self.get_persistence_info(info),
             'slow_queries': self.get_slow_queries(),
             'configuration': self.get_config(),
             'key_analysis': self.analyze_key_patterns(),
             'cluster_info': self.get_cluster_info() if self.cluster_mode else None,
-            'health_checks': self.perform_health_checks()
+            'health_checks': self.perform_health_checks(memory_info, stats_info)
         }
         
         return report
     
-    def perform_health_checks(self) -> List[Dict]:
+    def perform_health_checks(self, memory_info: Optional[Dict] = None,
+                              stats_info: Optional[Dict] = None) -> List[Dict]:
         """Perform health checks and return recommendations"""
         checks = []
         
         try:
-            memory_info = self.get_memory_info()
-            stats_info = self.get_stats_info()
+            # Only hit the server for whatever the caller didn't already fetch
+            if memory_info is None or stats_info is None:
+                info = self._get_all_info()
+                if memory_info is None:
+                    memory_info = self.get_memory_info(info)
+                if stats_info is None:
+                    stats_info = self.get_stats_info(info)
             
             # Memory usage check
             if memory_info.get('memory_usage_percent', 0) > 90:
@@ -576,12 +821,17 @@ def main():
     parser.add_argument('--password', help='Redis password')
     parser.add_argument('--db', type=int, default=0, help='Redis database number')
     parser.add_argument('--cluster', action='store_true', help='Connect to Redis cluster')
+    parser.add_argument('--match', help='Only sample keys matching this glob pattern (keys action)')
+    parser.add_argument('--log-stdout', action=argparse.BooleanOptionalAction, default=True,
+                        help='Also write log messages to stdout')
     parser.add_argument('--output', help='Output file for JSON report')
     parser.add_argument('--action', choices=['monitor', 'slowlog', 'keys', 'health'], 
                        default='monitor', help='Action to perform')
     
     args = parser.parse_args()
     
+    _configure_logging(args.log_stdout)
+    
     # Initialize Redis monitor
     monitor = RedisMonitor(
         host=args.host,
@@ -612,7 +862,7 @@ def main():
                 print()
         
         elif args.action == 'keys':
-            analysis = monitor.analyze_key_patterns(2000)
+            analysis = monitor.analyze_key_patterns(2000, match=args.match)
             print(f"\nKey Pattern Analysis:")
             print("-" * 50)
             print(f"Total keys analyzed: {analysis.get('total_keys_analyzed', 0)}")